@@ -44,6 +44,8 @@ import logging
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from .config import (
     TOP_K_RETRIEVAL, 
     MIN_SIMILARITY_THRESHOLD,
@@ -160,7 +162,11 @@ class WikipediaRAG:
         
         print("RAG system initialized successfully!")
     
-    def retrieve_context(self, query: str) -> Tuple[List[WikipediaChunk], List[float]]:
+    def retrieve_context(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> Tuple[List[WikipediaChunk], List[float]]:
         """
         Retrieve relevant context chunks for a query with intelligent auto-indexing.
         
@@ -180,6 +186,9 @@ class WikipediaRAG:
             query (str): The search query or question.
                         Should be a natural language question or topic.
                         Example: "What is machine learning?"
+            query_embedding (Optional[np.ndarray]): Embedding of the query from
+                        embedding_model.embed_query(), if the caller already
+                        computed it. Embedded here when omitted.
             
         Returns:
             Tuple[List[WikipediaChunk], List[float]]: A tuple containing:
@@ -197,8 +206,9 @@ class WikipediaRAG:
             searches and content processing, which can take additional time
             but ensures comprehensive coverage of the topic.
         """
-        # Generate query embedding first
-        query_embedding = self.embedding_model.embed_query(query)
+        # Generate query embedding first, unless the caller already has it
+        if query_embedding is None:
+            query_embedding = self.embedding_model.embed_query(query)
         
         # Try to find relevant chunks in existing index
         results = self.vector_store.search(query_embedding, k=TOP_K_RETRIEVAL)
@@ -0,0 +1,28 @@
+"""Add live messages index
+
+Revision ID: 5b2f9c8e1d47
+Revises: ccca1c017e18
+Create Date: 2026-10-16 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f9c8e1d47'
+down_revision: Union[str, Sequence[str], None] = 'ccca1c017e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_messages_conversation_live_created', 'messages', ['conversation_id', 'is_deleted', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_messages_conversation_live_created', table_name='messages')
@@ -22,6 +22,47 @@ if TYPE_CHECKING:
     from discord_llm_bot.bot.client import DiscordLLMBot
 
 
+# Prebuilt bodies for the common error responses. aiohttp responses cannot be
+# reused across requests, but the encoded bodies and headers can.
+_TEXT_CONTENT_TYPE = 'text/plain; charset=utf-8'
+_UNAUTH_BODY = b'Unauthorized'
+_NOT_READY_BODY = b'Bot not ready'
+_MISSING_FIELDS_BODY = b'Missing content or channel_id'
+_CHANNEL_NOT_FOUND_BODY = b'Channel not found'
+
+
+def _error_response(status: int, body: bytes) -> Response:
+    """Build a plain-text error response from a prebuilt body."""
+    return Response(
+        status=status,
+        body=body,
+        headers={
+            'Content-Type': _TEXT_CONTENT_TYPE,
+            'Content-Length': str(len(body)),
+        },
+    )
+
+
+def _unauth() -> Response:
+    """Response for requests without a valid bearer token."""
+    return _error_response(401, _UNAUTH_BODY)
+
+
+def _not_ready() -> Response:
+    """Response for requests received before the bot is ready."""
+    return _error_response(503, _NOT_READY_BODY)
+
+
+def _missing_fields() -> Response:
+    """Response for daily message requests without content or channel_id."""
+    return _error_response(400, _MISSING_FIELDS_BODY)
+
+
+def _channel_not_found() -> Response:
+    """Response for daily message requests targeting an unknown channel."""
+    return _error_response(404, _CHANNEL_NOT_FOUND_BODY)
+
+
 class InternalAPIServer:
     """
     Internal API server for bot communication.
@@ -117,7 +158,7 @@ class InternalAPIServer:
     async def _health_check(self, request: Request) -> Response:
         """Health check endpoint."""
         if not self._check_auth(request):
-            return Response(status=401, text='Unauthorized')
+            return _unauth()
             
         health_data = {
             'status': 'healthy',
@@ -134,7 +175,7 @@ class InternalAPIServer:
     async def _bot_status(self, request: Request) -> Response:
         """Get detailed bot status."""
         if not self._check_auth(request):
-            return Response(status=401, text='Unauthorized')
+            return _unauth()
             
         status_data = {
             'ready': self.bot.is_ready(),
@@ -152,10 +193,10 @@ class InternalAPIServer:
     async def _post_daily_message(self, request: Request) -> Response:
         """Post a daily message through the bot."""
         if not self._check_auth(request):
-            return Response(status=401, text='Unauthorized')
+            return _unauth()
             
         if not self.bot.is_ready():
-            return Response(status=503, text='Bot not ready')
+            return _not_ready()
             
         try:
             # Parse request body
@@ -164,12 +205,12 @@ class InternalAPIServer:
             channel_id = body.get('channel_id')
             
             if not message_content or not channel_id:
-                return Response(status=400, text='Missing content or channel_id')
+                return _missing_fields()
                 
             # Get the channel
             channel = self.bot.get_channel(int(channel_id))
             if not channel:
-                return Response(status=404, text='Channel not found')
+                return _channel_not_found()
                 
             # Send the message through the bot
             message = await channel.send(message_content)
@@ -202,10 +243,10 @@ class InternalAPIServer:
     async def _test_daily_message(self, request: Request) -> Response:
         """Test daily message posting without actually posting to Discord."""
         if not self._check_auth(request):
-            return Response(status=401, text='Unauthorized')
+            return _unauth()
             
         if not self.bot.is_ready():
-            return Response(status=503, text='Bot not ready')
+            return _not_ready()
             
         try:
             # Parse request body
@@ -214,12 +255,12 @@ class InternalAPIServer:
             channel_id = body.get('channel_id')
             
             if not message_content or not channel_id:
-                return Response(status=400, text='Missing content or channel_id')
+                return _missing_fields()
                 
             # Get the channel (just to verify it exists)
             channel = self.bot.get_channel(int(channel_id))
             if not channel:
-                return Response(status=404, text='Channel not found')
+                return _channel_not_found()
                 
             # Simulate posting (don't actually send)
             response_data = {
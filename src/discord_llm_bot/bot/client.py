@@ -10,15 +10,20 @@ with intelligent conversation threading and context management.
 """
 
 import asyncio
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, Optional, Dict, Any, Coroutine, Tuple
 
 import discord
-from discord.ext import commands
-
-if TYPE_CHECKING:
-    from discord_llm_bot.api.server import InternalAPIServer
+from discord.ext import commands, tasks
 
 from discord_llm_bot.config import AppConfig
+from discord_llm_bot.api.server import InternalAPIServer
+from discord_llm_bot.bot.commands import setup_commands
+from discord_llm_bot.bot.events import setup_events, teardown_events
+from discord_llm_bot.utils.avatar import update_bot_avatar
 from discord_llm_bot.utils.logging import (
     get_logger, 
     log_error, 
@@ -32,6 +37,57 @@ from discord_llm_bot.llm.client import LLMClient
 from discord_llm_bot.conversation.manager import ConversationManager
 from discord_llm_bot.database.repositories import DatabaseManager
 
+# Maximum number of bot-authored message IDs remembered for reply detection
+BOT_MESSAGE_CACHE_SIZE = 4096
+
+# Expected reply latency (seconds) above which the typing indicator is kept alive
+TYPING_KEEPALIVE_THRESHOLD_S = 8.0
+
+# Presence shown while the bot is online
+LISTENING_ACTIVITY = discord.Activity(
+    type=discord.ActivityType.listening,
+    name="your questions | /help",
+)
+
+# Reply length (characters) above which message splitting runs in an executor
+SPLIT_IN_EXECUTOR_THRESHOLD = 10_000
+
+# Discord's message length limit (characters)
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Minimum seconds between edits of a message that is still streaming
+# (Discord allows about five edits per five seconds per channel)
+STREAM_EDIT_INTERVAL_S = 1.0
+
+
+def _build_message_fields(
+    message: discord.Message,
+    bot_id: Optional[int],
+    is_dm: bool,
+) -> Dict[str, Any]:
+    """
+    Build the log fields for a received message.
+    
+    Args:
+        message: The Discord message that was received
+        bot_id: The bot's own user ID, if logged in
+        is_dm: Whether the message was sent in a DM
+        
+    Returns:
+        Keyword arguments for log_discord_event
+    """
+    return {
+        "user_id": message.author.id,
+        "username": str(message.author),
+        "display_name": message.author.display_name,
+        "channel_id": message.channel.id,
+        "guild_id": message.guild.id if message.guild else None,
+        "message_length": len(message.content),
+        "has_attachments": bool(message.attachments),
+        "is_dm": is_dm,
+        "mentions_bot": bot_id in message.raw_mentions if bot_id else False,
+    }
+
 
 class DiscordLLMBot(commands.Bot):
     """
@@ -84,11 +140,33 @@ class DiscordLLMBot(commands.Bot):
         self.llm_client: Optional[LLMClient] = None
         self.conversation_manager: Optional[ConversationManager] = None
         self.db_manager: Optional[DatabaseManager] = None
-        self.api_server: Optional["InternalAPIServer"] = None
+        self.api_server: Optional[InternalAPIServer] = None
         
         # Track if setup has been completed
         self._setup_complete = False
         
+        # The bot's user ID and display string, cached in on_ready()
+        self._bot_id: Optional[int] = None
+        self._bot_user_str = "Bot"
+        
+        # Whether INFO-level Discord event logs are emitted (refreshed in setup())
+        self._event_log_enabled = True
+        
+        # LLM output must never ping users or roles, even if it contains <@id>
+        self._allowed_mentions = discord.AllowedMentions.none()
+        
+        # Fire-and-forget tasks (e.g. message persistence) drained in close()
+        self._background_tasks: set[asyncio.Task] = set()
+        
+        # Recently sent bot message IDs (LRU) so replies to the bot can be
+        # detected without fetching the referenced message from Discord
+        self._bot_message_ids: OrderedDict[int, None] = OrderedDict()
+        
+        # Channels configured for shared context, checked on every message
+        self._shared_context_ids: frozenset[int] = frozenset(
+            filter(None, [config.conversation.shared_context_channel_id])
+        )
+        
     async def setup(self) -> None:
         """
         Set up all bot components.
@@ -104,10 +182,12 @@ class DiscordLLMBot(commands.Bot):
             
         self.logger.info("Setting up Discord LLM Bot components")
         
+        # Logging is configured before setup, so the level is stable from here
+        self._event_log_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+        
         try:
-            # Initialize database manager
+            # Create database manager (connected below)
             self.db_manager = DatabaseManager(self.config.database)
-            await self.db_manager.initialize()
             
             # Initialize LLM client
             self.llm_client = LLMClient(self.config.llm)
@@ -119,14 +199,26 @@ class DiscordLLMBot(commands.Bot):
                 db_manager=self.db_manager,
             )
             
-            # Load bot commands and events
-            await self._load_commands()
-            await self._load_events()
-            
             # Initialize internal API server
-            from discord_llm_bot.api.server import InternalAPIServer
             self.api_server = InternalAPIServer(self, port=8765)
-            await self.api_server.start()
+            
+            # Database connection, API server startup, and command/event
+            # loading are independent, so run them concurrently
+            await asyncio.gather(
+                self.db_manager.initialize(),
+                self.api_server.start(),
+                self._load_commands(),
+                self._load_events(),
+            )
+            
+            # Periodically verify the database pool
+            self._db_health_check.change_interval(
+                seconds=self.config.database.health_check_interval
+            )
+            self._db_health_check.start()
+            
+            # Load the privacy and RAG components without delaying login
+            self.conversation_manager.start_warm_up()
             
             self._setup_complete = True
             self.logger.info("Bot setup completed successfully")
@@ -135,52 +227,63 @@ class DiscordLLMBot(commands.Bot):
             self.logger.error("Failed to set up bot components", error=str(e))
             raise
     
+    @tasks.loop(seconds=60)
+    async def _db_health_check(self) -> None:
+        """Check database connectivity and log connection pool usage."""
+        if not self.db_manager:
+            return
+        
+        healthy = await self.db_manager.health_check()
+        self.logger.debug(
+            "Database health check",
+            healthy=healthy,
+            pool_status=self.db_manager.pool_status(),
+        )
+    
     async def _load_commands(self) -> None:
         """Load slash commands and text commands."""
         self.logger.debug("Loading bot commands")
         
-        # Import and load command modules
-        from discord_llm_bot.bot.commands import setup_commands
         await setup_commands(self)
         
     async def _load_events(self) -> None:
         """Load event handlers."""
         self.logger.debug("Loading event handlers")
         
-        # Import and load event handlers
-        from discord_llm_bot.bot.events import setup_events
         await setup_events(self)
     
     async def on_ready(self) -> None:
         """Called when the bot is ready and connected to Discord."""
-        guild_count = len(self.guilds)
-        user_count = sum(guild.member_count or 0 for guild in self.guilds)
-        
-        # Log the ready event
-        log_discord_event(
-            "bot_ready",
-            bot_user=str(self.user),
-            bot_id=self.user.id if self.user else None,
-            guild_count=guild_count,
-            user_count=user_count,
-            shard_count=self.shard_count,
-        )
+        self._bot_id = self.user.id if self.user else None
+        self._bot_user_str = str(self.user) if self.user else "Bot"
         
-        self.logger.info(
-            "Bot is ready and connected to Discord",
-            bot_user=str(self.user),
-            guild_count=guild_count,
-            user_count=user_count,
-        )
+        # Guild and member totals are only needed for the INFO-level logs
+        if self._event_log_enabled:
+            guild_count = len(self.guilds)
+            user_count = sum(filter(None, (guild.member_count for guild in self.guilds)))
+            
+            # Log the ready event
+            log_discord_event(
+                "bot_ready",
+                bot_user=self._bot_user_str,
+                bot_id=self._bot_id,
+                guild_count=guild_count,
+                user_count=user_count,
+                shard_count=self.shard_count,
+            )
+            
+            self.logger.info(
+                "Bot is ready and connected to Discord",
+                bot_user=self._bot_user_str,
+                guild_count=guild_count,
+                user_count=user_count,
+            )
         
         # Set bot status to online
         try:
             await self.change_presence(
                 status=discord.Status.online,
-                activity=discord.Activity(
-                    type=discord.ActivityType.listening,
-                    name="your messages"
-                )
+                activity=LISTENING_ACTIVITY,
             )
             self.logger.info("Bot status set to online")
         except Exception as e:
@@ -190,7 +293,6 @@ class DiscordLLMBot(commands.Bot):
         avatar_path = getattr(self.config.discord, 'avatar_path', None)
         if avatar_path:
             try:
-                from discord_llm_bot.utils.avatar import update_bot_avatar
                 await update_bot_avatar(self, avatar_path, force_update=False)
                 self.logger.info("Avatar updated successfully", avatar_path=avatar_path)
             except Exception as e:
@@ -206,14 +308,6 @@ class DiscordLLMBot(commands.Bot):
             self.logger.info(f"Synced {len(synced)} commands globally")
         except Exception as e:
             self.logger.error("Failed to sync commands globally", error=str(e))
-        
-        # Set bot presence
-        await self.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.listening,
-                name="your questions | /help"
-            )
-        )
     
     async def on_message(self, message: discord.Message) -> None:
         """
@@ -229,27 +323,26 @@ class DiscordLLMBot(commands.Bot):
         if message.author.bot:
             return
         
-        # Log the message event
-        log_discord_event(
-            "message_received",
-            user_id=message.author.id,
-            username=str(message.author),
-            display_name=message.author.display_name,
-            channel_id=message.channel.id,
-            guild_id=message.guild.id if message.guild else None,
-            message_length=len(message.content),
-            has_attachments=bool(message.attachments),
-            is_dm=isinstance(message.channel, discord.DMChannel),
-            mentions_bot=self.user in message.mentions if self.user else False,
-        )
+        # Classify the channel once and pass the result down
+        is_dm = message.channel.type is discord.ChannelType.private
+        is_shared_context = message.channel.id in self._shared_context_ids
+        
+        # Log the message event (fields are only built if the log is emitted)
+        if self._event_log_enabled:
+            log_discord_event(
+                "message_received",
+                **_build_message_fields(message, self._bot_id, is_dm),
+            )
         
         # Check if the bot should respond to this message
-        should_respond = await self._should_respond_to_message(message)
+        should_respond = await self._should_respond_to_message(message, is_dm=is_dm)
         
         # Only store for context if we're NOT going to respond 
         # (if we're responding, the message will be stored in _handle_conversation_message)
         if not should_respond:
-            await self._store_message_for_context(message)
+            await self._store_message_for_context(
+                message, is_dm=is_dm, is_shared_context=is_shared_context
+            )
         
         if should_respond:
             correlation_id = generate_correlation_id()
@@ -261,15 +354,25 @@ class DiscordLLMBot(commands.Bot):
             )
             
             try:
-                # Show typing indicator while processing
-                async with message.channel.typing():
+                # Show typing indicator while processing. A single typing
+                # request covers short replies; only keep it alive for slow ones
+                expected_latency = self.conversation_manager.expected_latency_s if self.conversation_manager else None
+                if expected_latency is None or expected_latency > TYPING_KEEPALIVE_THRESHOLD_S:
+                    typing = message.channel.typing()
+                else:
+                    await message.channel.typing()
+                    typing = contextlib.nullcontext()
+                
+                async with typing:
                     with log_operation_timing(
                         "handle_conversation_message",
                         user_id=message.author.id,
                         channel_id=message.channel.id,
                         correlation_id=correlation_id,
                     ):
-                        await self._handle_conversation_message(message)
+                        await self._handle_conversation_message(
+                            message, is_shared_context=is_shared_context
+                        )
                     
             except Exception as e:
                 log_error(e, {
@@ -278,27 +381,34 @@ class DiscordLLMBot(commands.Bot):
                     "user_id": message.author.id,
                     "correlation_id": correlation_id,
                 })
-                await self._send_error_response(message, "Sorry, I encountered an error processing your message.")
+                await self._send_error_response(
+                    message,
+                    "Sorry, I encountered an error processing your message.",
+                    is_shared_context=is_shared_context,
+                )
         
         # Always process commands (for text-based commands)
         await self.process_commands(message)
     
-    async def _should_respond_to_message(self, message: discord.Message) -> bool:
+    async def _should_respond_to_message(self, message: discord.Message, is_dm: bool) -> bool:
         """
         Determine if the bot should respond to a message.
         
         Args:
             message: The Discord message to check
+            is_dm: Whether the message was sent in a DM
             
         Returns:
             True if the bot should respond, False otherwise
         """
         # Always respond to DMs
-        if isinstance(message.channel, discord.DMChannel):
+        if is_dm:
             return True
         
-        # Respond if bot is mentioned
-        if self.user and self.user.mentioned_in(message):
+        # Respond if bot is mentioned (raw_mentions avoids comparing User objects)
+        if self._bot_id and (
+            message.mention_everyone or self._bot_id in message.raw_mentions
+        ):
             return True
         
         # Respond if replying to one of the bot's messages
@@ -306,19 +416,47 @@ class DiscordLLMBot(commands.Bot):
             message.reference.message_id and
             isinstance(message.channel, (discord.TextChannel, discord.Thread))):
             
-            try:
-                referenced_message = await message.channel.fetch_message(
-                    message.reference.message_id
-                )
-                if referenced_message.author == self.user:
-                    return True
-            except discord.NotFound:
-                # Referenced message was deleted
-                pass
+            referenced_id = message.reference.message_id
+            
+            # Fast path: we sent this message recently
+            if referenced_id in self._bot_message_ids:
+                self._bot_message_ids.move_to_end(referenced_id)
+                return True
+            
+            # Next try discord.py's in-memory message cache
+            referenced_message = self._connection._get_message(referenced_id)
+            
+            if referenced_message is None:
+                try:
+                    referenced_message = await message.channel.fetch_message(referenced_id)
+                except discord.NotFound:
+                    # Referenced message was deleted
+                    return False
+            
+            if referenced_message.author == self.user:
+                self._remember_bot_message(referenced_id)
+                return True
         
         return False
     
-    async def _store_message_for_context(self, message: discord.Message) -> None:
+    def _remember_bot_message(self, message_id: int) -> None:
+        """
+        Record a bot-authored message ID in the bounded LRU cache.
+        
+        Args:
+            message_id: Discord ID of a message sent by the bot
+        """
+        self._bot_message_ids[message_id] = None
+        self._bot_message_ids.move_to_end(message_id)
+        if len(self._bot_message_ids) > BOT_MESSAGE_CACHE_SIZE:
+            self._bot_message_ids.popitem(last=False)
+    
+    async def _store_message_for_context(
+        self,
+        message: discord.Message,
+        is_dm: bool,
+        is_shared_context: bool,
+    ) -> None:
         """
         Store a message for conversation context without generating a response.
         
@@ -331,24 +469,22 @@ class DiscordLLMBot(commands.Bot):
         
         Args:
             message: The Discord message to store
+            is_dm: Whether the message was sent in a DM
+            is_shared_context: Whether the channel is a shared context channel
         """
         if not self.conversation_manager:
             return  # Skip if conversation manager not initialized
 
+        # Only store for context in shared context channels or DMs
+        if not (is_dm or is_shared_context):
+            return  # Skip storage for non-shared channels
+        
         # Check if user has consented to data storage
         if not self.conversation_manager.privacy_manager.should_store_message(message.author.id):
             self.logger.debug(f"Skipping context storage for user {message.author.id} - no consent")
             return
         
-        # Only store for context in shared context channels or DMs
-        is_dm = isinstance(message.channel, discord.DMChannel)
-        is_shared_context_channel = (
-            self.conversation_manager.config.shared_context_channel_id is not None and
-            message.channel.id == self.conversation_manager.config.shared_context_channel_id
-        )
-        
-        if not (is_dm or is_shared_context_channel):
-            return  # Skip storage for non-shared channels
+        display_tag = f"@{message.author.display_name}"
         
         try:
             # Get or create conversation for this context
@@ -367,7 +503,7 @@ class DiscordLLMBot(commands.Bot):
                     "discord_message_id": message.id,
                     "discord_user_id": message.author.id,
                     "discord_username": str(message.author),
-                    "discord_display_name": f"@{message.author.display_name}",
+                    "discord_display_name": display_tag,
                     "stored_for_context": True,  # Flag to indicate this was stored for context only
                 }
             )
@@ -380,16 +516,26 @@ class DiscordLLMBot(commands.Bot):
                 "operation": "store_message_for_context",
             })
     
-    async def _handle_conversation_message(self, message: discord.Message) -> None:
+    async def _handle_conversation_message(
+        self,
+        message: discord.Message,
+        is_shared_context: Optional[bool] = None,
+    ) -> None:
         """
         Handle a conversation message and generate a response.
         
         Args:
             message: The Discord message to respond to
+            is_shared_context: Whether the channel is a shared context channel
+                (looked up if not given)
         """
         if not self.conversation_manager:
             raise ConversationError("Conversation manager not initialized")
 
+        # Mention-style tag used for both the stored message and the prompt
+        display_name = message.author.display_name
+        display_tag = f"@{display_name}"
+
         # Check if user has consented to data storage
         if not self.conversation_manager.privacy_manager.should_store_message(message.author.id):
             self.logger.info(f"User {message.author.id} has not consented to data storage - providing response without storing conversation")
@@ -400,7 +546,7 @@ class DiscordLLMBot(commands.Bot):
                 system_prompt = self.conversation_manager.default_system_prompt
                 
                 # Create a temporary conversation context with just this message
-                temp_context = f"Current user: @{message.author.display_name}\n{message.author.display_name}: {message.content}"
+                temp_context = f"Current user: {display_tag}\n{display_name}: {message.content}"
                 
                 # Generate response
                 response_content = await self.conversation_manager.llm_client.generate_response(
@@ -411,7 +557,7 @@ class DiscordLLMBot(commands.Bot):
                 )
                 
                 # Send response but don't store anything
-                await self._send_response(message, response_content)
+                await self._send_response(message, response_content, is_shared_context)
                 
                 # Log the privacy-respecting interaction
                 self.logger.info(f"Provided response to user {message.author.id} without data storage")
@@ -433,40 +579,63 @@ class DiscordLLMBot(commands.Bot):
                 guild_id=message.guild.id if message.guild else None,
             )
             
-            # Add the user message to conversation (since we're responding, 
-            # it wasn't stored for context)
-            await self.conversation_manager.add_message(
-                conversation_id=conversation_id,
-                content=message.content,
-                role="user",
-                extra_data={
+            # The user message (since we're responding, it wasn't stored for
+            # context) is written while the LLM generates the reply; the LLM
+            # gets it directly rather than waiting for the insert
+            user_record = {
+                "content": message.content,
+                "role": "user",
+                "extra_data": {
                     "discord_message_id": message.id,
                     "discord_user_id": message.author.id,
                     "discord_username": str(message.author),
-                    "discord_display_name": f"@{message.author.display_name}",
-                }
-            )
-
-            # Generate response from LLM
-            response_content = await self.conversation_manager.generate_response(
-                conversation_id=conversation_id,
-                current_user_name=f"@{message.author.display_name}"
+                    "discord_display_name": display_tag,
+                },
+            }
+            user_insert_task = asyncio.create_task(
+                self.conversation_manager.add_message(
+                    conversation_id=conversation_id, **user_record
+                )
             )
             
-            # Send response to Discord
-            response_message = await self._send_response(message, response_content)
+            try:
+                # Stream the LLM response into Discord as it is generated
+                response_message, response_content = await self._stream_response(
+                    message,
+                    self.conversation_manager.generate_response_stream(
+                        conversation_id=conversation_id,
+                        current_user_name=display_tag,
+                        pending_messages=[user_record],
+                    ),
+                    is_shared_context,
+                )
+            finally:
+                # The user message is persisted even if generation failed; an
+                # insert failure is logged rather than raised so it neither
+                # masks a generation error nor fails an already sent reply
+                try:
+                    await user_insert_task
+                except Exception as insert_error:
+                    log_error(insert_error, {
+                        "operation": "store_user_message",
+                        "conversation_id": conversation_id,
+                        "message_id": message.id,
+                    })
             
-            # Add bot response to conversation
+            # Add bot response to conversation without blocking the next message
             if response_message:
-                await self.conversation_manager.add_message(
-                    conversation_id=conversation_id,
-                    content=response_content,
-                    role="assistant",
-                    extra_data={
-                        "discord_message_id": response_message.id,
-                        "discord_user_id": self.user.id if self.user else None,
-                        "discord_username": str(self.user) if self.user else "Bot",
-                    }
+                self._create_background_task(
+                    self.conversation_manager.add_message(
+                        conversation_id=conversation_id,
+                        content=response_content,
+                        role="assistant",
+                        extra_data={
+                            "discord_message_id": response_message.id,
+                            "discord_user_id": self._bot_id,
+                            "discord_username": self._bot_user_str,
+                        },
+                    ),
+                    operation="store_assistant_message",
                 )
             
         except Exception as e:
@@ -474,38 +643,201 @@ class DiscordLLMBot(commands.Bot):
                             message_id=message.id, error=str(e))
             raise
     
-    async def _send_response(self, original_message: discord.Message, content: str) -> Optional[discord.Message]:
+    def _create_background_task(self, coro: Coroutine[Any, Any, Any], operation: str) -> asyncio.Task:
+        """
+        Run a coroutine in the background and keep it alive until it finishes.
+        
+        Pending tasks are awaited in close() so their writes are not lost
+        on shutdown. Failures are logged rather than raised.
+        
+        Args:
+            coro: The coroutine to run
+            operation: Operation name used when logging failures
+            
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        
+        def _on_done(done: asyncio.Task) -> None:
+            self._background_tasks.discard(done)
+            if not done.cancelled() and done.exception() is not None:
+                log_error(done.exception(), {"operation": operation})
+        
+        task.add_done_callback(_on_done)
+        return task
+    
+    async def _stream_response(
+        self,
+        original_message: discord.Message,
+        deltas: AsyncGenerator[str, None],
+        is_shared_context: Optional[bool] = None,
+    ) -> Tuple[Optional[discord.Message], str]:
+        """
+        Send a response message to Discord while it is being generated.
+        
+        The response is posted as soon as the first text arrives and edited
+        as more streams in, at most once per STREAM_EDIT_INTERVAL_S. Output
+        longer than one Discord message is split into follow-up messages
+        once the stream completes. If the stream or a send fails, the
+        messages already posted are deleted, so no truncated reply is left
+        that was never stored as a turn, and the error is raised for the
+        caller to report. The stream is always closed.
+        
+        Args:
+            original_message: The message being replied to
+            deltas: Consecutive pieces of the response text
+            is_shared_context: Whether the channel is a shared context channel
+                (looked up if not given)
+            
+        Returns:
+            Tuple of (first sent message or None, full response text)
+        """
+        if is_shared_context is None:
+            is_shared_context = original_message.channel.id in self._shared_context_ids
+        
+        parts: list[str] = []
+        sent_message = None
+        sent_messages: list[discord.Message] = []
+        shown = ""
+        last_edit = 0.0
+        
+        try:
+            async for delta in deltas:
+                parts.append(delta)
+                
+                now = time.monotonic()
+                if sent_message is not None and now - last_edit < STREAM_EDIT_INTERVAL_S:
+                    continue
+                
+                text = "".join(parts)
+                if not text.strip() or len(text) > DISCORD_MESSAGE_LIMIT:
+                    # Nothing to show yet, or the rest is sent split at the end
+                    continue
+                
+                if sent_message is None:
+                    if is_shared_context:
+                        # In shared context channel, post directly to channel (no reply)
+                        sent_message = await original_message.channel.send(
+                            text, allowed_mentions=self._allowed_mentions
+                        )
+                    else:
+                        # In private contexts (DMs, other channels), reply to user
+                        sent_message = await original_message.reply(
+                            text,
+                            allowed_mentions=self._allowed_mentions,
+                            mention_author=False,
+                        )
+                    sent_messages.append(sent_message)
+                    self._remember_bot_message(sent_message.id)
+                else:
+                    await sent_message.edit(content=text, allowed_mentions=self._allowed_mentions)
+                
+                shown = text
+                last_edit = now
+            
+            content = "".join(parts)
+            if sent_message is None:
+                return await self._send_response(original_message, content, is_shared_context), content
+            
+            # Show the final text, splitting it if the stream outgrew one message
+            if len(content) > SPLIT_IN_EXECUTOR_THRESHOLD:
+                chunks = await asyncio.get_running_loop().run_in_executor(
+                    None, self._split_message, content
+                )
+            else:
+                chunks = self._split_message(content)
+            
+            if chunks[0] != shown:
+                await sent_message.edit(content=chunks[0], allowed_mentions=self._allowed_mentions)
+            for chunk in chunks[1:]:
+                chunk_message = await original_message.channel.send(chunk, allowed_mentions=self._allowed_mentions)
+                sent_messages.append(chunk_message)
+                self._remember_bot_message(chunk_message.id)
+            
+            return sent_message, content
+            
+        except Exception as e:
+            await self._discard_partial_response(sent_messages)
+            if isinstance(e, discord.HTTPException):
+                raise DiscordAPIError(
+                    "Failed to send streamed response message",
+                    context={
+                        "channel_id": original_message.channel.id,
+                        "content_length": sum(map(len, parts)),
+                    },
+                    original_error=e
+                )
+            raise
+        finally:
+            # Release the LLM connection even if the stream was abandoned
+            await deltas.aclose()
+    
+    async def _discard_partial_response(self, sent_messages: list[discord.Message]) -> None:
+        """
+        Delete the messages of a response that failed part way through.
+        
+        Args:
+            sent_messages: Messages already posted for the response
+        """
+        for sent in sent_messages:
+            self._bot_message_ids.pop(sent.id, None)
+            try:
+                await sent.delete()
+            except discord.HTTPException as e:
+                self.logger.warning("Failed to delete partial response", message_id=sent.id, error=str(e))
+    
+    async def _send_response(
+        self,
+        original_message: discord.Message,
+        content: str,
+        is_shared_context: Optional[bool] = None,
+    ) -> Optional[discord.Message]:
         """
         Send a response message to Discord.
         
         Args:
             original_message: The message being replied to
             content: The response content
+            is_shared_context: Whether the channel is a shared context channel
+                (looked up if not given)
             
         Returns:
             The sent message, or None if sending failed
         """
         try:
             # Check if this is the shared context channel
-            is_shared_context = (
-                self.config.conversation.shared_context_channel_id is not None and
-                original_message.channel.id == self.config.conversation.shared_context_channel_id
-            )
+            if is_shared_context is None:
+                is_shared_context = original_message.channel.id in self._shared_context_ids
             
-            # Split long messages if needed (Discord has a 2000 character limit)
-            chunks = self._split_message(content)
+            # Split long messages if needed (Discord has a 2000 character limit).
+            # Very long outputs are split off the event loop.
+            if len(content) > SPLIT_IN_EXECUTOR_THRESHOLD:
+                chunks = await asyncio.get_running_loop().run_in_executor(
+                    None, self._split_message, content
+                )
+            else:
+                chunks = self._split_message(content)
             
             sent_message = None
             for i, chunk in enumerate(chunks):
                 if is_shared_context:
                     # In shared context channel, post directly to channel (no reply)
-                    sent_message = await original_message.channel.send(chunk)
+                    sent_message = await original_message.channel.send(chunk, allowed_mentions=self._allowed_mentions)
+                    self._remember_bot_message(sent_message.id)
                 else:
                     # In private contexts (DMs, other channels), reply to user
                     if i == 0:
-                        sent_message = await original_message.reply(chunk)
+                        sent_message = await original_message.reply(
+                            chunk,
+                            allowed_mentions=self._allowed_mentions,
+                            mention_author=False,
+                        )
+                        self._remember_bot_message(sent_message.id)
                     else:
-                        await original_message.channel.send(chunk)
+                        chunk_message = await original_message.channel.send(chunk, allowed_mentions=self._allowed_mentions)
+                        self._remember_bot_message(chunk_message.id)
             
             return sent_message
             
@@ -519,25 +851,32 @@ class DiscordLLMBot(commands.Bot):
                 original_error=e
             )
     
-    async def _send_error_response(self, message: discord.Message, error_text: str) -> None:
+    async def _send_error_response(
+        self,
+        message: discord.Message,
+        error_text: str,
+        is_shared_context: Optional[bool] = None,
+    ) -> None:
         """Send an error response to the user."""
         try:
             # Check if this is the shared context channel
-            is_shared_context = (
-                self.config.conversation.shared_context_channel_id is not None and
-                message.channel.id == self.config.conversation.shared_context_channel_id
-            )
+            if is_shared_context is None:
+                is_shared_context = message.channel.id in self._shared_context_ids
             
             if is_shared_context:
                 # In shared context channel, post directly to channel
-                await message.channel.send(f"❌ {error_text}")
+                await message.channel.send(f"❌ {error_text}", allowed_mentions=self._allowed_mentions)
             else:
                 # In private contexts, reply to user
-                await message.reply(f"❌ {error_text}")
+                await message.reply(
+                    f"❌ {error_text}",
+                    allowed_mentions=self._allowed_mentions,
+                    mention_author=False,
+                )
         except discord.HTTPException:
             # If we can't reply, try sending to the channel
             try:
-                await message.channel.send(f"❌ {error_text}")
+                await message.channel.send(f"❌ {error_text}", allowed_mentions=self._allowed_mentions)
             except discord.HTTPException:
                 # If all else fails, log the error
                 self.logger.error("Failed to send error response", 
@@ -555,45 +894,37 @@ class DiscordLLMBot(commands.Bot):
         Returns:
             List of message chunks
         """
-        if len(content) <= max_length:
+        n = len(content)
+        if n <= max_length:
             return [content]
         
-        chunks = []
-        current_chunk = ""
-        
-        # Split by lines first to try to preserve formatting
-        lines = content.split('\n')
-        
-        for line in lines:
-            # If a single line is too long, we need to split it
-            if len(line) > max_length:
-                # If we have a current chunk, add it first
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-                
-                # Split the long line
-                while len(line) > max_length:
-                    chunks.append(line[:max_length])
-                    line = line[max_length:]
-                
-                if line:
-                    current_chunk = line
+        chunks: list[str] = []
+        start = 0
+        while start < n:
+            # Blank lines between chunks are dropped
+            while start < n and content[start] == '\n':
+                start += 1
+            if start >= n:
+                break
+            
+            end = start + max_length
+            if end >= n:
+                chunk = content[start:].strip()
+                if chunk:
+                    chunks.append(chunk)
+                break
+            
+            # Break after the last whole line that fits, or slice mid-line when
+            # a single line is longer than the limit
+            newline = content.rfind('\n', start, end + 1)
+            if newline > start:
+                chunk = content[start:newline].strip()
+                if chunk:
+                    chunks.append(chunk)
+                start = newline + 1
             else:
-                # Check if adding this line would exceed the limit
-                if len(current_chunk) + len(line) + 1 > max_length:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = line
-                else:
-                    if current_chunk:
-                        current_chunk += '\n' + line
-                    else:
-                        current_chunk = line
-        
-        # Add the last chunk if there's content
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+                chunks.append(content[start:end])
+                start = end
         
         return chunks
     
@@ -602,23 +933,40 @@ class DiscordLLMBot(commands.Bot):
         self.logger.info("Shutting down Discord LLM Bot")
         
         try:
-            # Stop internal API server
-            if self.api_server:
-                await self.api_server.stop()
+            # Stop periodic database checks
+            self._db_health_check.cancel()
             
-            # Close database connections
-            if self.db_manager:
-                await self.db_manager.close()
+            # Don't hold up shutdown for the embedding model to finish loading
+            if self.conversation_manager:
+                self.conversation_manager.cancel_warm_up()
+            
+            # Stop the event logging loops, logging anything still queued
+            await teardown_events(self)
+            
+            # Let pending background writes finish before closing the database
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
             
-            # Close LLM client
+            # Stop the API server and close database and LLM connections in
+            # parallel; a failure in one does not stop the others
+            closers = {}
+            if self.api_server:
+                closers["api_server"] = self.api_server.stop()
+            if self.db_manager:
+                closers["database"] = self.db_manager.close()
             if self.llm_client:
-                await self.llm_client.close()
+                closers["llm_client"] = self.llm_client.close()
             
-            # Close Discord connection
-            await super().close()
+            results = await asyncio.gather(*closers.values(), return_exceptions=True)
+            for component, result in zip(closers, results):
+                if isinstance(result, BaseException):
+                    self.logger.error("Error closing component", component=component, error=str(result))
             
         except Exception as e:
             self.logger.error("Error during bot shutdown", error=str(e))
             raise
         finally:
+            # Close the Discord connection once everything else has drained,
+            # even if cleanup failed
+            await super().close()
             self.logger.info("Bot shutdown complete")
@@ -6,17 +6,223 @@ with the bot, including chat commands, conversation management, and
 utility functions.
 """
 
-from typing import Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from datetime import datetime
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
-from discord_llm_bot.utils.logging import get_logger, log_function_call
-from discord_llm_bot.utils.exceptions import ConversationError
+from discord_llm_bot.utils.logging import get_logger, log_error, log_function_call
+from discord_llm_bot.utils.exceptions import ConversationError, DiscordLLMBotError
 from discord_llm_bot.privacy.manager import UserConsent
 
+logger = get_logger(__name__)
+
+# Replies sent when a command fails
+CHAT_ERROR_MESSAGE = "❌ Sorry, I encountered an error processing your message."
+RESET_ERROR_MESSAGE = "❌ Sorry, I couldn't reset your conversation."
+CONTEXT_ERROR_MESSAGE = "❌ Sorry, I couldn't retrieve your conversation context."
+STATUS_ERROR_MESSAGE = "❌ Sorry, I couldn't retrieve status information."
+
+# Maximum number of /chat responses kept in the response cache
+RESPONSE_CACHE_SIZE = 1024
+
+# Seconds each /status health probe may take before it is reported as down
+STATUS_HEALTH_CHECK_TIMEOUT_S = 2.0
+
+# Seconds the /status member count is reused before being recounted
+STATS_CACHE_TTL_SECONDS = 30.0
+
+
+def _build_help_embed() -> discord.Embed:
+    """Build the static /help embed."""
+    embed = discord.Embed(
+        title="🤖 Discord LLM Bot Help",
+        color=discord.Color.green(),
+        description="I'm an AI assistant powered by a self-hosted LLM. Here's how to use me:"
+    )
+    
+    embed.add_field(
+        name="💬 Starting Conversations",
+        value="• Use `/chat <message>` to start a conversation\n"
+              "• @mention me anywhere to chat\n"
+              "• Reply to my messages to continue the conversation\n"
+              "• Send me a DM for private conversations",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🎛️ Commands",
+        value="• `/chat <message>` - Chat with the AI\n"
+              "• `/reset` - Reset your conversation history\n"
+              "• `/context` - Show your conversation stats\n"
+              "• `/help` - Show this help message",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🧠 Memory & Context",
+        value="• I remember our conversation history\n"
+              "• Each user/channel has separate conversations\n"
+              "• Context is managed automatically within token limits\n"
+              "• Use `/reset` to start fresh anytime",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="⚙️ Features",
+        value="• Powered by self-hosted LLM\n"
+              "• Persistent conversation memory\n"
+              "• Smart context management\n"
+              "• Multi-user support",
+        inline=False
+    )
+    
+    embed.set_footer(text="Need more help? Contact the bot administrator.")
+    
+    return embed
+
+
+def _build_privacy_menu_template() -> discord.Embed:
+    """Build the static parts of the /privacy embed; the per-user fields are inserted on use."""
+    embed = discord.Embed(
+        title="🔒 Privacy & Data Management",
+        description="Manage how your data is handled by the SCI-Assist bot.",
+        color=discord.Color.blue()
+    )
+    
+    embed.add_field(
+        name="Important Notes",
+        value="• Without consent, conversations are not stored but bot still helps you\n"
+              "• Training data is fully anonymized (no personal info)\n"
+              "• You can change preferences anytime",
+        inline=False
+    )
+    
+    return embed
+
+
+def _build_delete_data_embed() -> discord.Embed:
+    """Build the static /delete_data embed."""
+    embed = discord.Embed(
+        title="🗑️ Data Deletion Request",
+        description="⚠️ **Warning**: This will permanently delete all your conversation history and cannot be undone.",
+        color=discord.Color.red()
+    )
+    
+    embed.add_field(
+        name="What Will Be Deleted",
+        value="• All your stored messages\n"
+              "• Your conversation history\n"
+              "• Your consent preferences",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="What Will NOT Be Deleted",
+        value="• Anonymized training data (no personal info)\n"
+              "• Your Discord account (external to bot)",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="To Proceed",
+        value="Please contact a server moderator or administrator to process this request. "
+              "Include your Discord ID in the request for verification.",
+        inline=False
+    )
+    
+    return embed
+
+
+def _build_learn_more_embed() -> discord.Embed:
+    """Build the static privacy "Learn More" embed."""
+    embed = discord.Embed(
+        title="ℹ️ Privacy Information",
+        description="Learn more about how your data is handled.",
+        color=discord.Color.blue()
+    )
+    
+    embed.add_field(
+        name="Data We Collect",
+        value="• Messages you send to the bot\n"
+              "• Discord username and display name\n"
+              "• Channel and server information\n"
+              "• Message timestamps",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="How We Use It",
+        value="• Providing conversational context\n"
+              "• Improving bot responses (anonymized)\n"
+              "• Technical debugging and monitoring",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Your Rights",
+        value="• Right to consent or refuse data storage\n"
+              "• Right to export your data\n"
+              "• Right to delete your data\n"
+              "• Right to change preferences anytime",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Security",
+        value="• Data stored locally on secure servers\n"
+              "• Automatic cleanup of old data\n"
+              "• No sharing with third parties\n"
+              "• Training data fully anonymized",
+        inline=False
+    )
+    
+    return embed
+
+
+# Static embeds are built once at import and reused on every invocation
+_HELP_EMBED = _build_help_embed()
+_PRIVACY_MENU_TEMPLATE = _build_privacy_menu_template()
+_DELETE_DATA_EMBED = _build_delete_data_embed()
+_LEARN_MORE_EMBED = _build_learn_more_embed()
+
+# Replies to the PrivacyView consent buttons
+_CONSENT_RETENTION_EMBED = discord.Embed(
+    title="✅ Consent Updated",
+    description="You have consented to data retention for operational purposes.\n\n"
+                "**What this means:**\n"
+                "• Your conversations will be stored for up to 7 days\n"
+                "• This helps the bot maintain context in ongoing conversations\n"
+                "• Data is automatically deleted after the retention period",
+    color=discord.Color.green()
+)
+
+_CONSENT_TRAINING_EMBED = discord.Embed(
+    title="✅ Training Consent Updated",
+    description="You have consented to anonymized use of your conversations for training.\n\n"
+                "**What this means:**\n"
+                "• Your messages help improve the bot's responses\n"
+                "• All personal information is removed/anonymized\n"
+                "• Only conversation patterns are used, not personal data",
+    color=discord.Color.green()
+)
+
+_CONSENT_REVOKED_EMBED = discord.Embed(
+    title="❌ Consent Revoked",
+    description="Your consent has been revoked.\n\n"
+                "**What this means:**\n"
+                "• Future conversations will not be stored\n"
+                "• The bot will still respond to help you\n"
+                "• No conversation context will be maintained\n"
+                "• Existing data will be cleaned up according to retention policy",
+    color=discord.Color.red()
+)
+
 
 class ChatCommands(commands.Cog):
     """Chat-related commands for the LLM bot."""
@@ -24,7 +230,54 @@ class ChatCommands(commands.Cog):
     def __init__(self, bot) -> None:
         """Initialize the chat commands cog."""
         self.bot = bot
-        self.logger = get_logger(__name__)
+        # (conversation ID, history digest, Discord user ID, normalized message) -> response
+        self._response_cache: OrderedDict[tuple, str] = OrderedDict()
+    
+    def _response_cache_key(self, conversation_id: int, user_id: int, message: str) -> Optional[tuple]:
+        """
+        Build the response cache key for a new message in a conversation.
+        
+        The key covers everything the prompt depends on that can differ
+        between calls: the conversation and its history (via the running
+        digest kept by the conversation manager), the asking user, whose
+        name goes into the prompt, and the normalized message.
+        
+        Args:
+            conversation_id: Conversation ID
+            user_id: Discord user ID of the asking user
+            message: The user's new message
+            
+        Returns:
+            Cache key, or None if response caching is disabled
+        """
+        if not self.bot.config.rag.response_cache_enabled:
+            return None
+        
+        history_digest = self.bot.conversation_manager.history_digest(conversation_id)
+        return (conversation_id, history_digest, user_id, message.strip().lower())
+    
+    def _invalidate_response_cache(self, conversation_id: int) -> None:
+        """
+        Drop cached responses for a conversation.
+        
+        Args:
+            conversation_id: Conversation ID
+        """
+        for key in [key for key in self._response_cache if key[0] == conversation_id]:
+            del self._response_cache[key]
+    
+    def _cache_response(self, key: tuple, response: str) -> None:
+        """
+        Store a response in the LRU response cache.
+        
+        Args:
+            key: Cache key from _response_cache_key()
+            response: Generated response text
+        """
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
     
     @app_commands.command(name="chat", description="Start a conversation with the AI")
     @app_commands.describe(message="Your message to the AI")
@@ -36,7 +289,13 @@ class ChatCommands(commands.Cog):
             interaction: Discord slash command interaction
             message: The user's message to send to the AI
         """
-        log_function_call("chat_command", user_id=interaction.user.id, message_length=len(message))
+        user_id = interaction.user.id
+        user_str = str(interaction.user)
+        bot_user = self.bot.user
+        bot_user_id = bot_user.id if bot_user else None
+        bot_user_str = str(bot_user) if bot_user else "Bot"
+        
+        log_function_call("chat_command", user_id=user_id, message_length=len(message))
         
         await interaction.response.defer(thinking=True)
         
@@ -46,52 +305,84 @@ class ChatCommands(commands.Cog):
             
             # Get or create conversation
             conversation_id = await self.bot.conversation_manager.get_or_create_conversation(
-                user_id=interaction.user.id,
+                user_id=user_id,
                 channel_id=interaction.channel_id,
                 guild_id=interaction.guild_id,
             )
             
-            # Add user message
-            await self.bot.conversation_manager.add_message(
-                conversation_id=conversation_id,
-                content=message,
-                role="user",
-                extra_data={
-                    "discord_user_id": interaction.user.id,
-                    "discord_username": str(interaction.user),
+            # Key on the history before this message is added
+            cache_key = self._response_cache_key(conversation_id, user_id, message)
+            
+            # The user message is passed to the LLM directly and written
+            # together with the reply
+            user_record = {
+                "content": message,
+                "role": "user",
+                "extra_data": {
+                    "discord_user_id": user_id,
+                    "discord_username": user_str,
                     "command": "chat",
-                }
-            )
+                },
+            }
             
-            # Generate response
-            response = await self.bot.conversation_manager.generate_response(
-                conversation_id=conversation_id
-            )
+            # Generate response, reusing a cached one for the same history
+            response = self._response_cache.get(cache_key) if cache_key is not None else None
+            if response is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.debug("Chat response cache hit", conversation_id=conversation_id)
+            else:
+                try:
+                    response = await self.bot.conversation_manager.generate_response(
+                        conversation_id=conversation_id,
+                        pending_messages=[user_record],
+                    )
+                except Exception:
+                    # Persist the user message even if generation failed
+                    await self.bot.conversation_manager.add_message(
+                        conversation_id=conversation_id, **user_record
+                    )
+                    raise
+                if cache_key is not None:
+                    self._cache_response(cache_key, response)
             
             # Send response
             chunks = self.bot._split_message(response)
             
-            for i, chunk in enumerate(chunks):
-                if i == 0:
-                    await interaction.followup.send(chunk)
-                else:
-                    await interaction.followup.send(chunk)
+            # Chunks are sent one at a time so they arrive in order; the
+            # first replaces the deferred "thinking" response
+            for chunk in chunks:
+                await interaction.followup.send(chunk)
             
-            # Add bot response to conversation
-            await self.bot.conversation_manager.add_message(
-                conversation_id=conversation_id,
-                content=response,
-                role="assistant",
-                extra_data={
-                    "discord_user_id": self.bot.user.id if self.bot.user else None,
-                    "discord_username": str(self.bot.user) if self.bot.user else "Bot",
-                    "command": "chat",
-                }
+            # Add both turns to the conversation in one transaction, without
+            # holding up the command now that the reply has been sent
+            self.bot._create_background_task(
+                self.bot.conversation_manager.add_messages(
+                    conversation_id=conversation_id,
+                    messages=[
+                        user_record,
+                        {
+                            "content": response,
+                            "role": "assistant",
+                            "extra_data": {
+                                "discord_user_id": bot_user_id,
+                                "discord_username": bot_user_str,
+                                "command": "chat",
+                            },
+                        },
+                    ],
+                ),
+                operation="store_chat_messages",
             )
             
+        except DiscordLLMBotError as e:
+            logger.error("Error in chat command", error=str(e), user_id=user_id)
+            await interaction.followup.send(CHAT_ERROR_MESSAGE)
+        except discord.HTTPException as e:
+            # Discord itself failed, so a reply would most likely fail too
+            logger.error("Discord API error in chat command", status=e.status, error=str(e), user_id=user_id)
         except Exception as e:
-            self.logger.error("Error in chat command", error=str(e), user_id=interaction.user.id)
-            await interaction.followup.send("❌ Sorry, I encountered an error processing your message.")
+            log_error(e, {"operation": "chat_command", "user_id": user_id})
+            await interaction.followup.send(CHAT_ERROR_MESSAGE)
     
     @app_commands.command(name="reset", description="Reset your conversation history")
     async def reset_conversation(self, interaction: discord.Interaction) -> None:
@@ -107,23 +398,27 @@ class ChatCommands(commands.Cog):
             if not self.bot.conversation_manager:
                 raise ConversationError("Conversation manager not available")
             
-            await self.bot.conversation_manager.reset_conversation(
+            conversation_id = await self.bot.conversation_manager.reset_conversation(
                 user_id=interaction.user.id,
                 channel_id=interaction.channel_id,
                 guild_id=interaction.guild_id,
             )
+            self._invalidate_response_cache(conversation_id)
             
             await interaction.response.send_message(
                 "✅ Your conversation history has been reset!",
                 ephemeral=True
             )
             
+        except DiscordLLMBotError as e:
+            logger.error("Error in reset command", error=str(e), user_id=interaction.user.id)
+            await interaction.response.send_message(RESET_ERROR_MESSAGE, ephemeral=True)
+        except discord.HTTPException as e:
+            # Discord itself failed, so a reply would most likely fail too
+            logger.error("Discord API error in reset command", status=e.status, error=str(e), user_id=interaction.user.id)
         except Exception as e:
-            self.logger.error("Error in reset command", error=str(e), user_id=interaction.user.id)
-            await interaction.response.send_message(
-                "❌ Sorry, I couldn't reset your conversation.",
-                ephemeral=True
-            )
+            log_error(e, {"operation": "reset_command", "user_id": interaction.user.id})
+            await interaction.response.send_message(RESET_ERROR_MESSAGE, ephemeral=True)
     
     @app_commands.command(name="context", description="Show your current conversation context")
     async def show_context(self, interaction: discord.Interaction) -> None:
@@ -166,10 +461,12 @@ class ChatCommands(commands.Cog):
                 inline=True
             )
             
+            context_tokens = context_info['context_tokens']
+            context_window = self.bot.config.conversation.context_window_tokens
             embed.add_field(
                 name="🎯 Context Window",
-                value=f"**Used:** {context_info['context_tokens']}/{self.bot.config.conversation.context_window_tokens}\n"
-                      f"**Usage:** {context_info['context_tokens']/self.bot.config.conversation.context_window_tokens*100:.1f}%",
+                value=f"**Used:** {context_tokens}/{context_window}\n"
+                      f"**Usage:** {context_tokens/context_window*100:.1f}%",
                 inline=True
             )
             
@@ -182,12 +479,15 @@ class ChatCommands(commands.Cog):
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
+        except DiscordLLMBotError as e:
+            logger.error("Error in context command", error=str(e), user_id=interaction.user.id)
+            await interaction.response.send_message(CONTEXT_ERROR_MESSAGE, ephemeral=True)
+        except discord.HTTPException as e:
+            # Discord itself failed, so a reply would most likely fail too
+            logger.error("Discord API error in context command", status=e.status, error=str(e), user_id=interaction.user.id)
         except Exception as e:
-            self.logger.error("Error in context command", error=str(e), user_id=interaction.user.id)
-            await interaction.response.send_message(
-                "❌ Sorry, I couldn't retrieve your conversation context.",
-                ephemeral=True
-            )
+            log_error(e, {"operation": "context_command", "user_id": interaction.user.id})
+            await interaction.response.send_message(CONTEXT_ERROR_MESSAGE, ephemeral=True)
 
 
 class UtilityCommands(commands.Cog):
@@ -196,7 +496,33 @@ class UtilityCommands(commands.Cog):
     def __init__(self, bot) -> None:
         """Initialize the utility commands cog."""
         self.bot = bot
-        self.logger = get_logger(__name__)
+        self._user_count_cache: Optional[Tuple[float, int]] = None
+    
+    def _get_user_count(self) -> int:
+        """
+        Get the total member count across guilds, recounting at most every
+        STATS_CACHE_TTL_SECONDS.
+        
+        Returns:
+            Total member count
+        """
+        now = time.monotonic()
+        if self._user_count_cache and now - self._user_count_cache[0] < STATS_CACHE_TTL_SECONDS:
+            return self._user_count_cache[1]
+        
+        user_count = sum(guild.member_count or 0 for guild in self.bot.guilds)
+        self._user_count_cache = (now, user_count)
+        return user_count
+    
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        """Recount members after joining a guild."""
+        self._user_count_cache = None
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Recount members after leaving a guild."""
+        self._user_count_cache = None
     
     @app_commands.command(name="help", description="Show help information")
     async def help_command(self, interaction: discord.Interaction) -> None:
@@ -206,51 +532,7 @@ class UtilityCommands(commands.Cog):
         Args:
             interaction: Discord slash command interaction
         """
-        embed = discord.Embed(
-            title="🤖 Discord LLM Bot Help",
-            color=discord.Color.green(),
-            description="I'm an AI assistant powered by a self-hosted LLM. Here's how to use me:"
-        )
-        
-        embed.add_field(
-            name="💬 Starting Conversations",
-            value="• Use `/chat <message>` to start a conversation\n"
-                  "• @mention me anywhere to chat\n"
-                  "• Reply to my messages to continue the conversation\n"
-                  "• Send me a DM for private conversations",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎛️ Commands",
-            value="• `/chat <message>` - Chat with the AI\n"
-                  "• `/reset` - Reset your conversation history\n"
-                  "• `/context` - Show your conversation stats\n"
-                  "• `/help` - Show this help message",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🧠 Memory & Context",
-            value="• I remember our conversation history\n"
-                  "• Each user/channel has separate conversations\n"
-                  "• Context is managed automatically within token limits\n"
-                  "• Use `/reset` to start fresh anytime",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Features",
-            value="• Powered by self-hosted LLM\n"
-                  "• Persistent conversation memory\n"
-                  "• Smart context management\n"
-                  "• Multi-user support",
-            inline=False
-        )
-        
-        embed.set_footer(text="Need more help? Contact the bot administrator.")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_HELP_EMBED, ephemeral=True)
     
     @app_commands.command(name="status", description="Show bot status and health")
     async def status(self, interaction: discord.Interaction) -> None:
@@ -261,25 +543,27 @@ class UtilityCommands(commands.Cog):
             interaction: Discord slash command interaction
         """
         try:
-            # Check LLM connectivity
-            llm_status = "✅ Connected"
+            # Probe the LLM and database concurrently
+            probes = {}
             if self.bot.llm_client:
-                try:
-                    await self.bot.llm_client.health_check()
-                except Exception:
-                    llm_status = "❌ Disconnected"
-            else:
-                llm_status = "❌ Not initialized"
-            
-            # Check database connectivity
-            db_status = "✅ Connected"
+                probes["llm"] = self.bot.llm_client.health_check()
             if self.bot.db_manager:
-                try:
-                    await self.bot.db_manager.health_check()
-                except Exception:
-                    db_status = "❌ Disconnected"
-            else:
-                db_status = "❌ Not initialized"
+                probes["db"] = self.bot.db_manager.health_check()
+            
+            results = dict(zip(probes, await asyncio.gather(
+                *(asyncio.wait_for(probe, timeout=STATUS_HEALTH_CHECK_TIMEOUT_S) for probe in probes.values()),
+                return_exceptions=True,
+            )))
+            
+            def probe_status(name: str) -> str:
+                if name not in results:
+                    return "❌ Not initialized"
+                if isinstance(results[name], Exception):
+                    return "❌ Disconnected"
+                return "✅ Connected"
+            
+            llm_status = probe_status("llm")
+            db_status = probe_status("db")
             
             embed = discord.Embed(
                 title="🔍 Bot Status",
@@ -298,7 +582,7 @@ class UtilityCommands(commands.Cog):
             embed.add_field(
                 name="📊 Statistics",
                 value=f"**Guilds:** {len(self.bot.guilds)}\n"
-                      f"**Users:** {sum(guild.member_count or 0 for guild in self.bot.guilds)}\n"
+                      f"**Users:** {self._get_user_count()}\n"
                       f"**Latency:** {self.bot.latency*1000:.0f}ms",
                 inline=True
             )
@@ -313,12 +597,15 @@ class UtilityCommands(commands.Cog):
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
+        except DiscordLLMBotError as e:
+            logger.error("Error in status command", error=str(e))
+            await interaction.response.send_message(STATUS_ERROR_MESSAGE, ephemeral=True)
+        except discord.HTTPException as e:
+            # Discord itself failed, so a reply would most likely fail too
+            logger.error("Discord API error in status command", status=e.status, error=str(e))
         except Exception as e:
-            self.logger.error("Error in status command", error=str(e))
-            await interaction.response.send_message(
-                "❌ Sorry, I couldn't retrieve status information.",
-                ephemeral=True
-            )
+            log_error(e, {"operation": "status_command"})
+            await interaction.response.send_message(STATUS_ERROR_MESSAGE, ephemeral=True)
 
 
 class PrivacyCommands(commands.Cog):
@@ -327,7 +614,6 @@ class PrivacyCommands(commands.Cog):
     def __init__(self, bot) -> None:
         """Initialize the privacy commands cog."""
         self.bot = bot
-        self.logger = get_logger(__name__)
     
     @app_commands.command(name="privacy", description="Manage your data privacy settings")
     async def privacy_menu(self, interaction: discord.Interaction) -> None:
@@ -342,12 +628,7 @@ class PrivacyCommands(commands.Cog):
             return
         
         privacy_manager = self.bot.conversation_manager.privacy_manager
-        
-        embed = discord.Embed(
-            title="🔒 Privacy & Data Management",
-            description="Manage how your data is handled by the SCI-Assist bot.",
-            color=discord.Color.blue()
-        )
+        embed = _PRIVACY_MENU_TEMPLATE.copy()
         
         # Get current consent status
         user_id = interaction.user.id
@@ -362,19 +643,22 @@ class PrivacyCommands(commands.Cog):
             training_status = "❓ No preference set (default: no training use)"
             consent_date = "Never"
         
-        embed.add_field(
+        embed.insert_field_at(
+            0,
             name="Current Data Retention Status",
             value=f"{status}\n*Last updated: {consent_date}*",
             inline=False
         )
         
-        embed.add_field(
+        embed.insert_field_at(
+            1,
             name="Training Data Usage",
             value=f"{training_status}\n*Anonymized data for bot improvements*",
             inline=False
         )
         
-        embed.add_field(
+        embed.insert_field_at(
+            2,
             name="Data Retention Policy",
             value=f"• Operational data: {privacy_manager.policy.operational_days} days\n"
                   f"• Training data: Only with consent\n"
@@ -382,16 +666,8 @@ class PrivacyCommands(commands.Cog):
             inline=False
         )
         
-        embed.add_field(
-            name="Important Notes",
-            value="• Without consent, conversations are not stored but bot still helps you\n"
-                  "• Training data is fully anonymized (no personal info)\n"
-                  "• You can change preferences anytime",
-            inline=False
-        )
-        
         # Create buttons for privacy actions
-        view = PrivacyView(privacy_manager, user_id)
+        view = PrivacyView(privacy_manager, user_id, consent)
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     
@@ -440,155 +716,57 @@ class PrivacyCommands(commands.Cog):
         """Request deletion of user's personal data."""
         log_function_call("delete_data_command", user_id=interaction.user.id)
         
-        embed = discord.Embed(
-            title="🗑️ Data Deletion Request",
-            description="⚠️ **Warning**: This will permanently delete all your conversation history and cannot be undone.",
-            color=discord.Color.red()
-        )
-        
-        embed.add_field(
-            name="What Will Be Deleted",
-            value="• All your stored messages\n"
-                  "• Your conversation history\n"
-                  "• Your consent preferences",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="What Will NOT Be Deleted",
-            value="• Anonymized training data (no personal info)\n"
-                  "• Your Discord account (external to bot)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="To Proceed",
-            value="Please contact a server moderator or administrator to process this request. "
-                  "Include your Discord ID in the request for verification.",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_DELETE_DATA_EMBED, ephemeral=True)
 
 
 class PrivacyView(discord.ui.View):
     """Interactive view for privacy management."""
     
-    def __init__(self, privacy_manager, user_id: int):
+    def __init__(self, privacy_manager, user_id: int, consent: Optional[UserConsent] = None):
         super().__init__(timeout=300)
         self.privacy_manager = privacy_manager
         self.user_id = user_id
+        # Read once and updated in place by each button for the life of the view
+        self._consent = consent or privacy_manager.get_user_consent(user_id) or UserConsent(user_id=user_id)
     
     @discord.ui.button(label="✅ Consent to Data Storage", style=discord.ButtonStyle.green)
     async def consent_retention(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Handle consent to data retention."""
-        consent = self.privacy_manager.get_user_consent(self.user_id) or UserConsent(user_id=self.user_id)
+        consent = self._consent
         consent.data_retention_consent = True
         consent.consent_date = datetime.now()
         
         self.privacy_manager.update_user_consent(consent)
         
-        embed = discord.Embed(
-            title="✅ Consent Updated",
-            description="You have consented to data retention for operational purposes.\n\n"
-                       "**What this means:**\n"
-                       "• Your conversations will be stored for up to 7 days\n"
-                       "• This helps the bot maintain context in ongoing conversations\n"
-                       "• Data is automatically deleted after the retention period",
-            color=discord.Color.green()
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_CONSENT_RETENTION_EMBED, ephemeral=True)
     
     @discord.ui.button(label="📚 Consent to Training Use", style=discord.ButtonStyle.blurple)
     async def consent_training(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Handle consent to training data usage."""
-        consent = self.privacy_manager.get_user_consent(self.user_id) or UserConsent(user_id=self.user_id)
+        consent = self._consent
         consent.training_data_consent = True
         consent.consent_date = datetime.now()
         
         self.privacy_manager.update_user_consent(consent)
         
-        embed = discord.Embed(
-            title="✅ Training Consent Updated",
-            description="You have consented to anonymized use of your conversations for training.\n\n"
-                       "**What this means:**\n"
-                       "• Your messages help improve the bot's responses\n"
-                       "• All personal information is removed/anonymized\n"
-                       "• Only conversation patterns are used, not personal data",
-            color=discord.Color.green()
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_CONSENT_TRAINING_EMBED, ephemeral=True)
     
     @discord.ui.button(label="❌ Revoke All Consent", style=discord.ButtonStyle.red)
     async def revoke_consent(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Handle consent revocation."""
-        consent = self.privacy_manager.get_user_consent(self.user_id) or UserConsent(user_id=self.user_id)
+        consent = self._consent
         consent.data_retention_consent = False
         consent.training_data_consent = False
         consent.updated_date = datetime.now()
         
         self.privacy_manager.update_user_consent(consent)
         
-        embed = discord.Embed(
-            title="❌ Consent Revoked",
-            description="Your consent has been revoked.\n\n"
-                       "**What this means:**\n"
-                       "• Future conversations will not be stored\n"
-                       "• The bot will still respond to help you\n"
-                       "• No conversation context will be maintained\n"
-                       "• Existing data will be cleaned up according to retention policy",
-            color=discord.Color.red()
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_CONSENT_REVOKED_EMBED, ephemeral=True)
     
     @discord.ui.button(label="ℹ️ Learn More", style=discord.ButtonStyle.secondary)
     async def learn_more(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show more information about privacy."""
-        embed = discord.Embed(
-            title="ℹ️ Privacy Information",
-            description="Learn more about how your data is handled.",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="Data We Collect",
-            value="• Messages you send to the bot\n"
-                  "• Discord username and display name\n"
-                  "• Channel and server information\n"
-                  "• Message timestamps",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="How We Use It",
-            value="• Providing conversational context\n"
-                  "• Improving bot responses (anonymized)\n"
-                  "• Technical debugging and monitoring",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Your Rights",
-            value="• Right to consent or refuse data storage\n"
-                  "• Right to export your data\n"
-                  "• Right to delete your data\n"
-                  "• Right to change preferences anytime",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Security",
-            value="• Data stored locally on secure servers\n"
-                  "• Automatic cleanup of old data\n"
-                  "• No sharing with third parties\n"
-                  "• Training data fully anonymized",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_LEARN_MORE_EMBED, ephemeral=True)
 
 
 async def setup_commands(bot) -> None:
@@ -598,7 +776,6 @@ async def setup_commands(bot) -> None:
     Args:
         bot: The Discord bot instance
     """
-    logger = get_logger(__name__)
     logger.debug("Setting up bot commands")
     
     # Add command cogs
@@ -5,11 +5,16 @@ This module contains event handlers that respond to Discord events
 like errors, command failures, and other bot lifecycle events.
 """
 
-import traceback
-from typing import Any
+from __future__ import annotations
+
+import asyncio
+import logging
+import reprlib
+import sys
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from discord_llm_bot.utils.logging import (
     get_logger, 
@@ -18,6 +23,234 @@ from discord_llm_bot.utils.logging import (
     log_operation_timing,
 )
 
+# Replies sent for command errors
+COOLDOWN_MESSAGE_TEMPLATE = "⏰ This command is on cooldown. Try again in %.1f seconds."
+MISSING_PERMISSIONS_MESSAGE = "❌ You don't have permission to use this command."
+UNEXPECTED_ERROR_MESSAGE = "❌ An unexpected error occurred while processing your command."
+
+# Size-capped repr for event arguments in error logs; stops building the
+# repr at the limits instead of formatting everything and slicing
+_EVENT_ARGS_REPR = reprlib.Repr()
+_EVENT_ARGS_REPR.maxstring = 200
+_EVENT_ARGS_REPR.maxother = 500
+_EVENT_ARGS_REPR.maxlist = _EVENT_ARGS_REPR.maxtuple = _EVENT_ARGS_REPR.maxdict = 8
+
+# Coroutine replying to an expected command error
+ErrorHandler = Callable[[Any, Exception], Awaitable[None]]
+
+# Maximum number of handler errors waiting to be logged
+ERROR_LOG_QUEUE_SIZE = 256
+
+# Seconds between flushes of buffered message edit/delete debug records
+LOG_BATCH_INTERVAL_S = 0.25
+
+# Maximum number of edit/delete records emitted in one log entry
+LOG_BATCH_MAX_SIZE = 64
+
+
+def _build_welcome_embed() -> discord.Embed:
+    """Build the static welcome embed sent when the bot joins a guild."""
+    embed = discord.Embed(
+        title="👋 Hello! Thanks for adding me!",
+        color=discord.Color.green(),
+        description="I'm an AI assistant powered by a self-hosted LLM. I can chat, answer questions, and help with various tasks!"
+    )
+    
+    embed.add_field(
+        name="🚀 Getting Started",
+        value="• Use `/chat <message>` to start a conversation\n"
+              "• Use `/help` to see all available commands\n"
+              "• @mention me anywhere to chat\n"
+              "• Reply to my messages to continue conversations",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="⚙️ Setup",
+        value="Make sure I have permission to:\n"
+              "• Read and send messages\n"
+              "• Use slash commands\n"
+              "• Read message history (for context)",
+        inline=False
+    )
+    
+    return embed
+
+
+# Built once at import and reused for every guild join
+_WELCOME_EMBED = _build_welcome_embed()
+
+
+async def _ignore_command_error(ctx: commands.Context, error: commands.CommandError) -> None:
+    """Ignore errors that need no reply, such as unknown commands."""
+
+
+async def _send_command_cooldown(ctx: commands.Context, error: commands.CommandOnCooldown) -> None:
+    """Tell the user when the command comes off cooldown."""
+    await ctx.send(COOLDOWN_MESSAGE_TEMPLATE % error.retry_after)
+
+
+async def _send_command_missing_permissions(ctx: commands.Context, error: commands.MissingPermissions) -> None:
+    """Tell the user they lack permission for the command."""
+    await ctx.send(MISSING_PERMISSIONS_MESSAGE)
+
+
+async def _send_command_missing_argument(ctx: commands.Context, error: commands.MissingRequiredArgument) -> None:
+    """Tell the user which argument is missing."""
+    await ctx.send(f"❌ Missing required argument: `{error.param.name}`")
+
+
+async def _send_command_bad_argument(ctx: commands.Context, error: commands.BadArgument) -> None:
+    """Tell the user an argument was invalid."""
+    await ctx.send(f"❌ Invalid argument provided: {error}")
+
+
+async def _send_app_command_cooldown(
+    interaction: discord.Interaction,
+    error: discord.app_commands.CommandOnCooldown,
+) -> None:
+    """Tell the user when the slash command comes off cooldown."""
+    await interaction.response.send_message(
+        COOLDOWN_MESSAGE_TEMPLATE % error.retry_after,
+        ephemeral=True
+    )
+
+
+async def _send_app_command_missing_permissions(
+    interaction: discord.Interaction,
+    error: discord.app_commands.MissingPermissions,
+) -> None:
+    """Tell the user they lack permission for the slash command."""
+    await interaction.response.send_message(
+        MISSING_PERMISSIONS_MESSAGE,
+        ephemeral=True
+    )
+
+
+async def _send_app_command_bad_argument(
+    interaction: discord.Interaction,
+    error: discord.app_commands.TransformerError,
+) -> None:
+    """Tell the user a slash command argument was invalid."""
+    await interaction.response.send_message(
+        f"❌ Invalid argument provided: {error}",
+        ephemeral=True
+    )
+
+
+# Replies for expected command errors, keyed by error type
+_COMMAND_ERROR_HANDLERS: Dict[type, ErrorHandler] = {
+    commands.CommandNotFound: _ignore_command_error,
+    commands.CommandOnCooldown: _send_command_cooldown,
+    commands.MissingPermissions: _send_command_missing_permissions,
+    commands.MissingRequiredArgument: _send_command_missing_argument,
+    commands.BadArgument: _send_command_bad_argument,
+}
+
+# Replies for expected slash command errors, keyed by error type
+_APP_COMMAND_ERROR_HANDLERS: Dict[type, ErrorHandler] = {
+    discord.app_commands.CommandOnCooldown: _send_app_command_cooldown,
+    discord.app_commands.MissingPermissions: _send_app_command_missing_permissions,
+    discord.app_commands.TransformerError: _send_app_command_bad_argument,
+}
+
+
+def _find_error_handler(handlers: Dict[type, ErrorHandler], error: Exception) -> Optional[ErrorHandler]:
+    """
+    Find the handler for an error, matching subclasses of the registered types.
+    
+    Args:
+        handlers: Handlers keyed by error type
+        error: The error to handle
+        
+    Returns:
+        The handler for the most specific matching type, or None
+    """
+    handler = handlers.get(type(error))
+    if handler:
+        return handler
+    
+    for error_type in type(error).__mro__[1:]:
+        handler = handlers.get(error_type)
+        if handler:
+            return handler
+    
+    return None
+
+
+class _EventLogBuffers:
+    """
+    Handler errors and message edit/delete records waiting to be logged.
+    
+    Errors are logged one at a time by drain_error_logs, so formatting never
+    delays event dispatch; edit/delete records are emitted in batches by
+    flush_message_logs. close() stops both loops and logs what is left.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize empty buffers."""
+        self.logger = get_logger(__name__)
+        self.error_logs: asyncio.Queue = asyncio.Queue(maxsize=ERROR_LOG_QUEUE_SIZE)
+        self.dropped_error_logs = 0
+        self.edited_messages: list[dict] = []
+        self.deleted_messages: list[dict] = []
+    
+    def queue_error_log(self, error: Exception, context: dict) -> None:
+        """Queue an error for drain_error_logs, dropping it if the queue is full."""
+        try:
+            self.error_logs.put_nowait((error, context))
+        except asyncio.QueueFull:
+            self.dropped_error_logs += 1
+    
+    def start(self) -> None:
+        """Start the logging loops unless they are already running."""
+        if not self.drain_error_logs.is_running():
+            self.drain_error_logs.start()
+        if not self.flush_message_logs.is_running():
+            self.flush_message_logs.start()
+    
+    async def close(self) -> None:
+        """Stop the logging loops and log everything still buffered."""
+        # drain_error_logs waits on the queue, so it is cancelled rather
+        # than stopped after its current iteration
+        self.drain_error_logs.cancel()
+        self.flush_message_logs.cancel()
+        
+        while not self.error_logs.empty():
+            log_error(*self.error_logs.get_nowait())
+        self._report_dropped_error_logs()
+        
+        await self.flush_message_logs()
+    
+    @tasks.loop()
+    async def drain_error_logs(self) -> None:
+        """Log queued handler errors one at a time."""
+        error, context = await self.error_logs.get()
+        log_error(error, context)
+        self._report_dropped_error_logs()
+    
+    @tasks.loop(seconds=LOG_BATCH_INTERVAL_S)
+    async def flush_message_logs(self) -> None:
+        """Emit the buffered edit and delete debug records in batches."""
+        for event, buffer in (
+            ("Messages edited", self.edited_messages),
+            ("Bot messages deleted", self.deleted_messages),
+        ):
+            if not buffer:
+                continue
+            
+            items = buffer[:]
+            buffer.clear()
+            for start in range(0, len(items), LOG_BATCH_MAX_SIZE):
+                batch = items[start:start + LOG_BATCH_MAX_SIZE]
+                self.logger.debug(event, count=len(batch), batch=batch)
+    
+    def _report_dropped_error_logs(self) -> None:
+        """Log how many errors were dropped while the queue was full."""
+        if self.dropped_error_logs:
+            self.logger.warning("Dropped error logs while the queue was full", count=self.dropped_error_logs)
+            self.dropped_error_logs = 0
+
 
 async def setup_events(bot) -> None:
     """
@@ -29,6 +262,13 @@ async def setup_events(bot) -> None:
     logger = get_logger(__name__)
     logger.debug("Setting up event handlers")
     
+    # Errors and edit/delete records from the handlers below are logged off
+    # the dispatch path; the buffers outlive a repeated setup
+    event_logs = getattr(bot, "_event_logs", None)
+    if event_logs is None:
+        event_logs = bot._event_logs = _EventLogBuffers()
+    event_logs.start()
+    
     @bot.event
     async def on_command_error(ctx: commands.Context, error: commands.CommandError) -> None:
         """
@@ -38,41 +278,21 @@ async def setup_events(bot) -> None:
             ctx: Command context
             error: The error that occurred
         """
-        logger = get_logger(__name__)
-        
-        # Ignore command not found errors
-        if isinstance(error, commands.CommandNotFound):
-            return
-        
-        # Handle cooldown errors
-        if isinstance(error, commands.CommandOnCooldown):
-            await ctx.send(f"⏰ This command is on cooldown. Try again in {error.retry_after:.1f} seconds.")
-            return
-        
-        # Handle missing permissions
-        if isinstance(error, commands.MissingPermissions):
-            await ctx.send("❌ You don't have permission to use this command.")
-            return
-        
-        # Handle missing arguments
-        if isinstance(error, commands.MissingRequiredArgument):
-            await ctx.send(f"❌ Missing required argument: `{error.param.name}`")
-            return
-        
-        # Handle bad arguments
-        if isinstance(error, commands.BadArgument):
-            await ctx.send(f"❌ Invalid argument provided: {error}")
+        # Handle expected errors (cooldowns, permissions, bad input)
+        handler = _find_error_handler(_COMMAND_ERROR_HANDLERS, error)
+        if handler:
+            await handler(ctx, error)
             return
         
         # Log and handle unexpected errors
-        log_error(error, {
+        event_logs.queue_error_log(error, {
             "command": ctx.command.name if ctx.command else "unknown",
             "user_id": ctx.author.id,
             "channel_id": ctx.channel.id,
             "guild_id": ctx.guild.id if ctx.guild else None,
         })
         
-        await ctx.send("❌ An unexpected error occurred while processing your command.")
+        await ctx.send(UNEXPECTED_ERROR_MESSAGE)
     
     @bot.event
     async def on_app_command_error(
@@ -86,34 +306,14 @@ async def setup_events(bot) -> None:
             interaction: The interaction that caused the error
             error: The error that occurred
         """
-        logger = get_logger(__name__)
-        
-        # Handle cooldown errors
-        if isinstance(error, discord.app_commands.CommandOnCooldown):
-            await interaction.response.send_message(
-                f"⏰ This command is on cooldown. Try again in {error.retry_after:.1f} seconds.",
-                ephemeral=True
-            )
-            return
-        
-        # Handle missing permissions
-        if isinstance(error, discord.app_commands.MissingPermissions):
-            await interaction.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
-        # Handle transformation errors (bad arguments)
-        if isinstance(error, discord.app_commands.TransformerError):
-            await interaction.response.send_message(
-                f"❌ Invalid argument provided: {error}",
-                ephemeral=True
-            )
+        # Handle expected errors (cooldowns, permissions, bad input)
+        handler = _find_error_handler(_APP_COMMAND_ERROR_HANDLERS, error)
+        if handler:
+            await handler(interaction, error)
             return
         
         # Log and handle unexpected errors
-        log_error(error, {
+        event_logs.queue_error_log(error, {
             "command": interaction.command.name if interaction.command else "unknown",
             "user_id": interaction.user.id,
             "channel_id": interaction.channel_id,
@@ -121,12 +321,10 @@ async def setup_events(bot) -> None:
         })
         
         # Send error response
-        error_message = "❌ An unexpected error occurred while processing your command."
-        
         if interaction.response.is_done():
-            await interaction.followup.send(error_message, ephemeral=True)
+            await interaction.followup.send(UNEXPECTED_ERROR_MESSAGE, ephemeral=True)
         else:
-            await interaction.response.send_message(error_message, ephemeral=True)
+            await interaction.response.send_message(UNEXPECTED_ERROR_MESSAGE, ephemeral=True)
     
     @bot.event
     async def on_error(event: str, *args: Any, **kwargs: Any) -> None:
@@ -138,17 +336,14 @@ async def setup_events(bot) -> None:
             *args: Event arguments
             **kwargs: Event keyword arguments
         """
-        logger = get_logger(__name__)
-        
         # Get the current exception
-        import sys
-        exc_type, exc_value, exc_traceback = sys.exc_info()
+        exc_value = sys.exc_info()[1]
         
         if exc_value:
-            log_error(exc_value, {
+            event_logs.queue_error_log(exc_value, {
                 "event": event,
-                "args": str(args)[:500],  # Limit length to prevent spam
-                "kwargs": str(kwargs)[:500],
+                "args": _EVENT_ARGS_REPR.repr(args),  # Limit length to prevent spam
+                "kwargs": _EVENT_ARGS_REPR.repr(kwargs),
             })
         else:
             logger.error("Unknown error in event", event=event)
@@ -161,42 +356,25 @@ async def setup_events(bot) -> None:
         Args:
             guild: The guild that was joined
         """
-        logger = get_logger(__name__)
         logger.info("Bot joined new guild", 
                    guild_id=guild.id, 
                    guild_name=guild.name,
                    member_count=guild.member_count)
         
-        # Try to send a welcome message to the system channel
-        if guild.system_channel and guild.system_channel.permissions_for(guild.me).send_messages:
-            embed = discord.Embed(
-                title="👋 Hello! Thanks for adding me!",
-                color=discord.Color.green(),
-                description="I'm an AI assistant powered by a self-hosted LLM. I can chat, answer questions, and help with various tasks!"
-            )
-            
-            embed.add_field(
-                name="🚀 Getting Started",
-                value="• Use `/chat <message>` to start a conversation\n"
-                      "• Use `/help` to see all available commands\n"
-                      "• @mention me anywhere to chat\n"
-                      "• Reply to my messages to continue conversations",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚙️ Setup",
-                value="Make sure I have permission to:\n"
-                      "• Read and send messages\n"
-                      "• Use slash commands\n"
-                      "• Read message history (for context)",
-                inline=False
-            )
-            
-            try:
-                await guild.system_channel.send(embed=embed)
-            except discord.HTTPException:
-                logger.warning("Failed to send welcome message", guild_id=guild.id)
+        # Try to send a welcome message to the system channel; the welcome
+        # is an embed, so it needs embed_links as well as send_messages
+        system_channel = guild.system_channel
+        if system_channel is None:
+            return
+        
+        permissions = system_channel.permissions_for(guild.me)
+        if not (permissions.send_messages and permissions.embed_links):
+            return
+        
+        try:
+            await system_channel.send(embed=_WELCOME_EMBED)
+        except discord.HTTPException:
+            logger.warning("Failed to send welcome message", guild_id=guild.id)
     
     @bot.event
     async def on_guild_remove(guild: discord.Guild) -> None:
@@ -206,7 +384,6 @@ async def setup_events(bot) -> None:
         Args:
             guild: The guild that was left
         """
-        logger = get_logger(__name__)
         logger.info("Bot removed from guild", 
                    guild_id=guild.id, 
                    guild_name=guild.name)
@@ -221,7 +398,6 @@ async def setup_events(bot) -> None:
         Args:
             member: The member that joined
         """
-        logger = get_logger(__name__)
         logger.debug("New member joined", 
                     user_id=member.id,
                     guild_id=member.guild.id)
@@ -234,12 +410,19 @@ async def setup_events(bot) -> None:
         Args:
             message: The message that was deleted
         """
-        # Only log if it was one of our messages
-        if message.author == bot.user:
-            logger = get_logger(__name__)
-            logger.debug("Bot message deleted", 
-                        message_id=message.id,
-                        channel_id=message.channel.id)
+        # Deletes are only logged at DEBUG, so skip everything else first
+        if not logging.root.isEnabledFor(logging.DEBUG):
+            return
+        
+        # Only log if it was one of our messages (bot ID is cached in on_ready;
+        # None before then, so nothing matches)
+        if message.author.id != bot._bot_id:
+            return
+        
+        event_logs.deleted_messages.append({
+            "message_id": message.id,
+            "channel_id": message.channel.id,
+        })
     
     @bot.event
     async def on_message_edit(before: discord.Message, after: discord.Message) -> None:
@@ -250,16 +433,34 @@ async def setup_events(bot) -> None:
             before: The message before editing
             after: The message after editing
         """
-        # Ignore bot messages and messages with no content change
-        if before.author.bot or before.content == after.content:
+        # Ignore bot messages
+        if before.author.bot:
+            return
+        
+        # Ignore link preview updates, which Discord delivers as edits
+        # without an edit timestamp, and edits that leave the text unchanged
+        if after.edited_at is None or before.content == after.content:
             return
         
-        logger = get_logger(__name__)
-        logger.debug("Message edited", 
-                    message_id=after.id,
-                    user_id=after.author.id,
-                    channel_id=after.channel.id)
+        if logging.root.isEnabledFor(logging.DEBUG):
+            event_logs.edited_messages.append({
+                "message_id": after.id,
+                "user_id": after.author.id,
+                "channel_id": after.channel.id,
+            })
         
         # TODO: Optionally handle edited messages in conversations
     
     logger.info("Event handlers setup complete")
+
+
+async def teardown_events(bot) -> None:
+    """
+    Stop the event logging loops and log anything still buffered.
+    
+    Args:
+        bot: The Discord bot instance
+    """
+    event_logs = getattr(bot, "_event_logs", None)
+    if event_logs is not None:
+        await event_logs.close()
@@ -11,11 +11,28 @@ production deployment.
 """
 
 import os
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+@lru_cache(maxsize=8)
+def _load_prompt_file(path: str, mtime: float) -> str:
+    """
+    Read a system prompt file, cached per path and modification time.
+    
+    Args:
+        path: Path to the prompt file
+        mtime: File modification time, used only as part of the cache key
+        
+    Returns:
+        The stripped file contents
+    """
+    return Path(path).read_text(encoding='utf-8').strip()
 
 
 class DatabaseConfig(BaseSettings):
@@ -29,9 +46,48 @@ class DatabaseConfig(BaseSettings):
         default=False,
         description="Echo SQL queries to logs"
     )
+    pool_size: int = Field(
+        default=5,
+        gt=0,
+        description="Number of connections kept open in the pool"
+    )
+    max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections allowed beyond pool_size under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    pool_recycle: int = Field(
+        default=3600,
+        ge=-1,
+        description="Seconds after which pooled connections are replaced (-1 disables)"
+    )
+    max_connections: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Connection cap of the database server (e.g. Postgres max_connections) that the pool must fit within"
+    )
+    health_check_interval: int = Field(
+        default=60,
+        gt=0,
+        description="Seconds between background database health checks"
+    )
+    
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", frozen=True)
     
-    class Config:
-        env_prefix = "DATABASE_"
+    @model_validator(mode="after")
+    def validate_pool_limits(self) -> "DatabaseConfig":
+        """Validate that the pool can never exceed the server's connection cap."""
+        if self.max_connections is not None and self.pool_size + self.max_overflow > self.max_connections:
+            raise ValueError(
+                f"pool_size + max_overflow ({self.pool_size + self.max_overflow}) "
+                f"exceeds max_connections ({self.max_connections})"
+            )
+        return self
 
 
 class DiscordConfig(BaseSettings):
@@ -54,10 +110,10 @@ class DiscordConfig(BaseSettings):
         description="Path to bot avatar image file"
     )
     
-    class Config:
-        env_prefix = "DISCORD_"
+    model_config = SettingsConfigDict(env_prefix="DISCORD_", frozen=True)
         
-    @validator("token")
+    @field_validator("token")
+    @classmethod
     def validate_token(cls, v: str) -> str:
         """Validate Discord token format."""
         if not v or len(v) < 50:
@@ -106,17 +162,15 @@ class LLMConfig(BaseSettings):
         description="Path to file containing system prompt"
     )
     
-    class Config:
-        env_prefix = "LLM_"
+    model_config = SettingsConfigDict(env_prefix="LLM_", frozen=True)
     
     def get_system_prompt(self) -> Optional[str]:
         """Get the system prompt, loading from file if specified."""
         if self.system_prompt_file:
             try:
-                from pathlib import Path
-                prompt_file = Path(self.system_prompt_file)
-                if prompt_file.exists():
-                    return prompt_file.read_text(encoding='utf-8').strip()
+                # The mtime is part of the cache key so edits are picked up
+                mtime = Path(self.system_prompt_file).stat().st_mtime
+                return _load_prompt_file(self.system_prompt_file, mtime)
             except Exception:
                 # Fall back to direct system_prompt if file loading fails
                 pass
@@ -161,8 +215,56 @@ class RAGConfig(BaseSettings):
         description="Include Wikipedia source attribution in responses"
     )
     
-    class Config:
-        env_prefix = "RAG_"
+    # Response caches: semantic for RAG queries, exact for /chat
+    response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse the response to a near-identical earlier query in the same conversation and history"
+    )
+    
+    model_config = SettingsConfigDict(env_prefix="RAG_", frozen=True)
+    
+    @cached_property
+    def trigger_pattern(self) -> re.Pattern:
+        """
+        Get a compiled pattern matching any trigger keyword.
+        
+        Keywords are lowercased and longest-first, so the pattern is meant
+        to be searched against lowercased text.
+        
+        Returns:
+            Compiled alternation of all trigger keywords
+        """
+        keywords = sorted({kw.lower() for kw in self.trigger_keywords}, key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, keywords)) or r"(?!)")
+    
+    @cached_property
+    def single_word_trigger_keywords(self) -> frozenset:
+        """
+        Get the lowercased trigger keywords that are a single word.
+        
+        Returns:
+            Frozenset of single-word keywords
+        """
+        return frozenset(kw.lower() for kw in self.trigger_keywords if " " not in kw)
+    
+    def find_trigger_keyword(self, text_lower: str) -> Optional[str]:
+        """
+        Find a trigger keyword contained in some text.
+        
+        Whole-word hits on single-word keywords are found with a set lookup;
+        the pattern scan handles phrases and keywords inside longer words.
+        
+        Args:
+            text_lower: Lowercased text to search
+            
+        Returns:
+            The matched keyword, or None if no keyword occurs in the text
+        """
+        for word in self.single_word_trigger_keywords.intersection(text_lower.split()):
+            return word
+        
+        match = self.trigger_pattern.search(text_lower)
+        return match.group(0) if match else None
 
 
 class ConversationConfig(BaseSettings):
@@ -188,8 +290,7 @@ class ConversationConfig(BaseSettings):
         description="Channel ID for shared context conversations (None for no shared context)"
     )
     
-    class Config:
-        env_prefix = "CONVERSATION_"
+    model_config = SettingsConfigDict(env_prefix="CONVERSATION_", frozen=True)
 
 
 class LoggingConfig(BaseSettings):
@@ -204,10 +305,10 @@ class LoggingConfig(BaseSettings):
         description="Log format: 'json' or 'text'"
     )
     
-    class Config:
-        env_prefix = "LOG_"
+    model_config = SettingsConfigDict(env_prefix="LOG_", frozen=True)
         
-    @validator("level")
+    @field_validator("level")
+    @classmethod
     def validate_level(cls, v: str) -> str:
         """Validate logging level."""
         valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -215,7 +316,8 @@ class LoggingConfig(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
         
-    @validator("format")
+    @field_validator("format")
+    @classmethod
     def validate_format(cls, v: str) -> str:
         """Validate log format."""
         if v not in {"json", "text"}:
@@ -243,30 +345,19 @@ class AppConfig(BaseSettings):
     conversation: ConversationConfig = Field(default_factory=ConversationConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     
-    class Config:
-        # Load from .env file if present
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        
-    def __init__(self, **kwargs):
-        """Initialize configuration with sub-configs."""
-        super().__init__(**kwargs)
-        
-        # Initialize sub-configurations with environment variables
-        self.database = DatabaseConfig()
-        self.discord = DiscordConfig()
-        self.llm = LLMConfig()
-        self.rag = RAGConfig()
-        self.conversation = ConversationConfig()
-        self.logging = LoggingConfig()
+    # Load from .env file if present
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """
     Load and validate application configuration.
     
     This function loads configuration from environment variables and .env files,
     validates all settings, and returns a fully configured AppConfig instance.
+    The result is cached, so repeated calls return the same instance; use
+    ``load_config.cache_clear()`` to reload.
     
     Returns:
         AppConfig: Validated application configuration
@@ -290,12 +381,23 @@ def load_config() -> AppConfig:
     return AppConfig()
 
 
-# Global configuration instance
-# This is loaded once when the module is imported
-try:
-    config = load_config()
-except Exception as e:
-    # In case of configuration errors during import, create a minimal config
-    # This allows the module to be imported for testing or documentation
-    print(f"Warning: Failed to load configuration: {e}")
-    config = None
+def __getattr__(name: str):
+    """
+    Load the global ``config`` instance on first access.
+    
+    The environment is not parsed at import time; ``config`` is built by
+    load_config() the first time it is read and is None if the configuration
+    is invalid, so the module can still be imported for testing or
+    documentation.
+    """
+    if name != "config":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        value = load_config()
+    except Exception as e:
+        print(f"Warning: Failed to load configuration: {e}")
+        value = None
+    
+    globals()["config"] = value
+    return value
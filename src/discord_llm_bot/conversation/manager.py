@@ -7,10 +7,19 @@ interactions. It serves as the central coordination point between
 the Discord bot, LLM client, and database.
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime
 
-from discord_llm_bot.config import ConversationConfig, AppConfig
+from sqlalchemy import select
+
+from discord_llm_bot.config import ConversationConfig, AppConfig, RAGConfig
 from discord_llm_bot.utils.logging import (
     get_logger, 
     log_function_call, 
@@ -23,9 +32,124 @@ from discord_llm_bot.llm.models import ChatMessage, MessageRole
 from discord_llm_bot.database.repositories import DatabaseManager
 from discord_llm_bot.database.models import User, Conversation, Message
 from discord_llm_bot.conversation.memory import MemoryManager
-from discord_llm_bot.rag.integration import RAGIntegration
+from discord_llm_bot.conversation.response_cache import SemanticResponseCache
 from discord_llm_bot.privacy.manager import PrivacyManager, RetentionPolicy
 
+if TYPE_CHECKING:
+    from discord_llm_bot.rag.integration import RAGIntegration
+
+# Smoothing factor for the moving average of response generation latency
+LATENCY_EMA_ALPHA = 0.2
+
+# Prepared LLM contexts kept in the LRU context cache
+CONTEXT_CACHE_SIZE = 512
+
+# Conversation owners kept in the LRU conversation-to-user cache
+CONVERSATION_USER_CACHE_SIZE = 4096
+
+# Resolved conversation IDs kept in the LRU conversation lookup cache
+CONVERSATION_ID_CACHE_SIZE = 10_000
+
+# Running history digests kept in the LRU history digest cache
+HISTORY_DIGEST_CACHE_SIZE = 4096
+
+# Most recent messages quoted in the per-call conversation context note
+RECENT_CONTEXT_MESSAGES = 5
+
+# Long assistant replies matching this are summarized in the context note
+LIST_REPLY_PATTERN = re.compile(r"Injuries|recommendations")
+
+# Discord ID of the placeholder user that owns shared context conversations
+SHARED_CONTEXT_DISCORD_ID = 999999999999999999
+
+# Name used for messages without a recorded Discord name
+DEFAULT_USERNAME = "User"
+
+# Responses mentioning any of these (lowercase) get no follow-up question
+EMERGENCY_RESPONSE_KEYWORDS = ("emergency", "doctor", "medical attention", "call 911", "urgent")
+
+# Follow-up questions keyed by topic keywords in the last user message,
+# highest priority first
+FOLLOWUP_TOPICS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("transfer", "moving", "getting up", "getting out"),
+     "What transfer techniques have worked best for others here?"),
+    (("wheelchair", "chair", "wheels"),
+     "Anyone have experience with similar equipment?"),
+    (("sport", "racing", "athletic", "exercise", "fitness"),
+     "Has anyone else tried this activity?"),
+    (("pain", "hurt", "sore", "ache"),
+     "What pain management strategies have others found helpful?"),
+    (("tech", "app", "device", "phone", "computer"),
+     "What other helpful tech tools are people using?"),
+    (("work", "job", "career", "employment"),
+     "How have others navigated workplace accommodations?"),
+    (("travel", "trip", "vacation", "flying"),
+     "What are your best travel tips for accessibility?"),
+    (("help", "advice", "tips", "suggestions"),
+     "What has everyone else found helpful in similar situations?"),
+    (("new", "first time", "just got", "recently"),
+     "What advice would others give to someone just starting out?"),
+    (("problem", "issue", "trouble", "difficult"),
+     "How have others dealt with similar challenges?"),
+)
+
+# Follow-up question when no topic keyword matches
+DEFAULT_FOLLOWUP = "What experiences have others had with this?"
+
+
+def _find_followup_question(text_lower: str) -> str:
+    """
+    Pick the follow-up question for the first topic mentioned in a message.
+    
+    Args:
+        text_lower: Lowercased message text
+        
+    Returns:
+        The question for the highest priority matching topic, or
+        DEFAULT_FOLLOWUP if no topic keyword appears
+    """
+    # Plain nested loops; next()/any() generators cost more than the
+    # substring checks themselves
+    for keywords, question in FOLLOWUP_TOPICS:
+        for keyword in keywords:
+            if keyword in text_lower:
+                return question
+    
+    return DEFAULT_FOLLOWUP
+
+
+def _load_rag_integration(config: RAGConfig) -> "RAGIntegration":
+    """
+    Import and initialize the RAG integration.
+    
+    This loads the embedding model and blocks; run it in a worker thread.
+    
+    Args:
+        config: RAG configuration
+        
+    Returns:
+        The initialized RAG integration
+    """
+    from discord_llm_bot.rag.integration import RAGIntegration
+    return RAGIntegration(config)
+
+
+def _extract_username(message: Message) -> str:
+    """
+    Get the Discord name recorded on a message, preferring the display name.
+    
+    ``extra_data`` is a JSON column, so it is already a dict (or None) when
+    loaded from the database.
+    
+    Args:
+        message: Conversation message
+        
+    Returns:
+        Display name, username, or "User" if neither was recorded
+    """
+    extra_data = message.extra_data or {}
+    return extra_data.get("discord_display_name") or extra_data.get("discord_username") or DEFAULT_USERNAME
+
 
 class ConversationManager:
     """
@@ -71,19 +195,24 @@ class ConversationManager:
         self.memory_manager = MemoryManager(config.conversation)
         self.logger = get_logger(__name__)
         
-        # Initialize privacy manager
-        privacy_policy = RetentionPolicy(
+        # The privacy manager is built on first use (see the property below);
+        # the RAG integration is loaded by warm_up(), since the RAG system
+        # loads an embedding model, and RAG is unavailable until then
+        self._privacy_policy = RetentionPolicy(
             operational_days=7,
             training_days=30,
             user_consent_required=True,
             auto_cleanup_enabled=True
         )
         # Extract database file path from the database URL
-        db_path = self.db_manager.config.url.replace("sqlite:///", "").replace("./", "")
-        self.privacy_manager = PrivacyManager(db_path, privacy_policy)
+        self._privacy_db_path = self.db_manager.config.url.replace("sqlite:///", "").replace("./", "")
+        self._rag_config = config.rag
+        self._rag_integration: Optional["RAGIntegration"] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
         
-        # Initialize RAG integration
-        self.rag_integration = RAGIntegration(config.rag)
+        # Responses reused for near-duplicate RAG queries, if enabled in the
+        # RAG config (needs the RAG embedder)
+        self.response_cache = SemanticResponseCache()
         
         # Use system prompt from config (file or direct) or fallback to default
         self.default_system_prompt = config.llm.get_system_prompt() or (
@@ -94,8 +223,200 @@ class ConversationManager:
             "If you're unsure about something, say so rather than guessing."
         )
         
+        # Exponential moving average of generate_response() duration (seconds)
+        self._response_latency_ema: Optional[float] = None
+        
+        # prepare_context() results keyed by conversation, history version and prompt
+        self._context_cache: OrderedDict[tuple, Tuple[List[ChatMessage], int]] = OrderedDict()
+        
+        # Conversation ID -> database user ID of its owner
+        self._conversation_user_ids: OrderedDict[int, int] = OrderedDict()
+        
+        # (channel ID, guild ID, Discord user ID or 0 if shared) -> conversation ID
+        self._conversation_ids: OrderedDict[Tuple[int, Optional[int], int], int] = OrderedDict()
+        
+        # Conversation ID -> running digest of the history added through this manager
+        self._history_digests: OrderedDict[int, bytes] = OrderedDict()
+        
         log_function_call("ConversationManager.__init__")
     
+    @cached_property
+    def privacy_manager(self) -> PrivacyManager:
+        """Privacy manager, created on first access."""
+        return PrivacyManager(self._privacy_db_path, self._privacy_policy)
+    
+    @property
+    def rag_integration(self) -> Optional["RAGIntegration"]:
+        """RAG integration, or None until warm_up() has finished loading it."""
+        return self._rag_integration
+    
+    def start_warm_up(self) -> asyncio.Task:
+        """
+        Start initializing the lazily created components in the background.
+        
+        The load runs once, as a stored task; later calls return the same
+        task. The RAG system is built in a worker thread so the event loop
+        stays responsive while the embedding model loads, and responses are
+        generated without RAG until it is ready.
+        
+        Returns:
+            The warm-up task
+        """
+        if self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(
+                self._load_components(), name="conversation_manager_warm_up"
+            )
+        return self._warm_up_task
+    
+    async def warm_up(self) -> None:
+        """Initialize the lazily created components and wait until they are ready."""
+        await asyncio.shield(self.start_warm_up())
+    
+    def cancel_warm_up(self) -> None:
+        """Stop waiting for an unfinished warm-up, e.g. on shutdown."""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+    
+    async def _load_components(self) -> None:
+        """Build the privacy manager and, if enabled, the RAG integration."""
+        # Opening the privacy database is quick, so it stays on the loop; on
+        # failure it is retried on first use
+        try:
+            _ = self.privacy_manager
+        except Exception as e:
+            self.logger.error("Failed to initialize privacy manager", error=str(e))
+        
+        if self._rag_config.enabled:
+            try:
+                self._rag_integration = await asyncio.to_thread(
+                    _load_rag_integration, self._rag_config
+                )
+            except Exception as e:
+                self.logger.error("Failed to load RAG integration, continuing without RAG", error=str(e))
+        
+        self.logger.info("Conversation manager components initialized")
+    
+    @property
+    def expected_latency_s(self) -> Optional[float]:
+        """Expected response generation time in seconds, or None if unknown."""
+        return self._response_latency_ema
+    
+    def _record_response_latency(self, duration_s: float) -> None:
+        """Fold a response generation duration into the moving average."""
+        if self._response_latency_ema is None:
+            self._response_latency_ema = duration_s
+        else:
+            self._response_latency_ema += LATENCY_EMA_ALPHA * (
+                duration_s - self._response_latency_ema
+            )
+    
+    def _prepare_context_cached(
+        self,
+        conversation_id: int,
+        messages: List[Message],
+        system_prompt: str,
+        context_note: Optional[str] = None,
+    ) -> Tuple[List[ChatMessage], int]:
+        """
+        Prepare the LLM context, reusing the result for an unchanged history.
+        
+        Messages are append-only between resets, so the last message's ID
+        (or Discord message ID, for records not yet stored) together with
+        the message count identifies the history version.
+        
+        Args:
+            conversation_id: Conversation ID
+            messages: Conversation history
+            system_prompt: System prompt
+            context_note: Optional per-call note passed to prepare_context()
+            
+        Returns:
+            Tuple of (chat_messages, total_tokens); treat as read-only
+        """
+        last = messages[-1] if messages else None
+        version = None
+        if last is not None:
+            version = last.id
+            if version is None and isinstance(last.extra_data, dict):
+                version = last.extra_data.get("discord_message_id")
+        
+        if last is not None and version is None:
+            # No stable identity for the newest message; don't cache
+            return self.memory_manager.prepare_context(
+                messages=messages,
+                system_prompt=system_prompt,
+                context_note=context_note,
+            )
+        
+        key = (conversation_id, version, len(messages), hash(system_prompt), hash(context_note))
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            self._context_cache.move_to_end(key)
+            return cached
+        
+        result = self.memory_manager.prepare_context(
+            messages=messages,
+            system_prompt=system_prompt,
+            context_note=context_note,
+        )
+        self._context_cache[key] = result
+        if len(self._context_cache) > CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
+        return result
+    
+    def _invalidate_context_cache(self, conversation_id: int) -> None:
+        """
+        Drop cached contexts for a conversation.
+        
+        Args:
+            conversation_id: Conversation ID
+        """
+        for key in [key for key in self._context_cache if key[0] == conversation_id]:
+            del self._context_cache[key]
+    
+    def history_digest(self, conversation_id: int) -> bytes:
+        """
+        Get a digest identifying a conversation's current history.
+        
+        The digest changes whenever a message is added or the conversation
+        is reset. A conversation not seen yet (or evicted) starts from a
+        random digest, so it never matches one handed out earlier.
+        
+        Args:
+            conversation_id: Conversation ID
+            
+        Returns:
+            16-byte history digest
+        """
+        digest = self._history_digests.get(conversation_id)
+        if digest is None:
+            digest = self._history_digests[conversation_id] = os.urandom(16)
+            if len(self._history_digests) > HISTORY_DIGEST_CACHE_SIZE:
+                self._history_digests.popitem(last=False)
+        self._history_digests.move_to_end(conversation_id)
+        return digest
+    
+    def _advance_history_digest(self, conversation_id: int, records: List[Tuple[str, str]]) -> None:
+        """
+        Chain added messages into a conversation's history digest.
+        
+        Args:
+            conversation_id: Conversation ID
+            records: (role, content) of each added message, in order
+        """
+        digest = self._history_digests.get(conversation_id)
+        if digest is None:
+            # Not tracked; history_digest() starts it from a fresh value
+            return
+        
+        running = hashlib.blake2b(digest, digest_size=16)
+        for role, content in records:
+            running.update(role.encode())
+            running.update(b"\0")
+            running.update(content.encode())
+            running.update(b"\0")
+        self._history_digests[conversation_id] = running.digest()
+    
     async def get_or_create_conversation(
         self,
         user_id: int,
@@ -134,11 +455,18 @@ class ConversationManager:
                 channel_id == self.config.shared_context_channel_id
             )
             
+            # Conversations are only replaced by cleanup, which flushes this
+            cache_key = (channel_id, guild_id, 0 if is_shared_context else user_id)
+            conversation_id = self._conversation_ids.get(cache_key)
+            if conversation_id is not None:
+                self._conversation_ids.move_to_end(cache_key)
+                return conversation_id
+            
             if is_shared_context:
                 # Shared context: use a shared "user" for the channel
                 # Create a special shared user for this channel
                 shared_user = await self.db_manager.get_or_create_user(
-                    discord_id=999999999999999999,  # Special ID for shared context
+                    discord_id=SHARED_CONTEXT_DISCORD_ID,
                     username=f"SharedContext_{channel_id}",
                 )
                 
@@ -176,6 +504,10 @@ class ConversationManager:
                     channel_id=channel_id,
                 )
             
+            self._cache_conversation_user_id(conversation.id, conversation.user_id)
+            self._conversation_ids[cache_key] = conversation.id
+            if len(self._conversation_ids) > CONVERSATION_ID_CACHE_SIZE:
+                self._conversation_ids.popitem(last=False)
             return conversation.id
             
         except Exception as e:
@@ -219,23 +551,12 @@ class ConversationManager:
         )
         
         try:
-            # Get user ID from conversation
-            async with self.db_manager.get_session() as session:
-                from sqlalchemy import select
-                stmt = select(Conversation).where(Conversation.id == conversation_id)
-                result = await session.execute(stmt)
-                conversation = result.scalar_one_or_none()
-                
-                if not conversation:
-                    raise ConversationError(f"Conversation {conversation_id} not found")
-                
-                user_id = conversation.user_id
+            user_id = await self._get_conversation_user_id(conversation_id)
             
             # Check privacy consent for user messages
             if role == "user" and not self.privacy_manager.should_store_message(user_id):
                 self.logger.info(f"Skipping message storage for user {user_id} - no consent")
                 # Return a mock message that won't be persisted
-                from datetime import datetime
                 return Message(
                     id=-1,
                     conversation_id=conversation_id,
@@ -252,6 +573,9 @@ class ConversationManager:
             chat_msg = ChatMessage(role=MessageRole(role), content=content)
             token_count = self.memory_manager.count_message_tokens(chat_msg)
             
+            self._invalidate_context_cache(conversation_id)
+            self._advance_history_digest(conversation_id, [(role, content)])
+            
             # Add message to database
             message = await self.db_manager.add_message(
                 conversation_id=conversation_id,
@@ -275,29 +599,195 @@ class ConversationManager:
                 original_error=e,
             )
     
+    async def add_messages(
+        self,
+        conversation_id: int,
+        messages: List[Dict[str, Any]],
+    ) -> List[Message]:
+        """
+        Add several messages to a conversation in one database round-trip.
+        
+        User messages are skipped if the conversation owner has not
+        consented to data storage, matching add_message().
+        
+        Args:
+            conversation_id: Conversation ID
+            messages: Message records with ``content``, ``role`` and optional
+                ``extra_data`` keys
+            
+        Returns:
+            Created messages
+            
+        Raises:
+            ConversationError: If the messages cannot be added
+        """
+        log_function_call(
+            "add_messages",
+            conversation_id=conversation_id,
+            message_count=len(messages),
+        )
+        
+        try:
+            user_id = await self._get_conversation_user_id(conversation_id)
+            
+            store_user_messages = self.privacy_manager.should_store_message(user_id)
+            if not store_user_messages:
+                self.logger.info(f"Skipping message storage for user {user_id} - no consent")
+            
+            kept = [
+                record for record in messages
+                if record["role"] != "user" or store_user_messages
+            ]
+            
+            # Count tokens for all messages in one encoder call
+            token_counts = self.memory_manager.count_message_tokens_batch([
+                ChatMessage(role=MessageRole(record["role"]), content=record["content"])
+                for record in kept
+            ])
+            records = [
+                {
+                    "role": record["role"],
+                    "content": record["content"],
+                    "token_count": token_count,
+                    "extra_data": record.get("extra_data"),
+                }
+                for record, token_count in zip(kept, token_counts)
+            ]
+            
+            self._invalidate_context_cache(conversation_id)
+            self._advance_history_digest(
+                conversation_id, [(record["role"], record["content"]) for record in records]
+            )
+            
+            return await self.db_manager.add_messages(
+                conversation_id=conversation_id,
+                user_id=user_id,
+                messages=records,
+            )
+            
+        except Exception as e:
+            raise ConversationError(
+                "Failed to add messages to conversation",
+                context={
+                    "conversation_id": conversation_id,
+                    "message_count": len(messages),
+                },
+                original_error=e,
+            )
+    
+    def _cache_conversation_user_id(self, conversation_id: int, user_id: int) -> None:
+        """
+        Remember the owner of a conversation in the LRU owner cache.
+        
+        Args:
+            conversation_id: Conversation ID
+            user_id: Database user ID of the conversation owner
+        """
+        self._conversation_user_ids[conversation_id] = user_id
+        self._conversation_user_ids.move_to_end(conversation_id)
+        if len(self._conversation_user_ids) > CONVERSATION_USER_CACHE_SIZE:
+            self._conversation_user_ids.popitem(last=False)
+    
+    async def _get_conversation_user_id(self, conversation_id: int) -> int:
+        """
+        Look up the database user ID that owns a conversation.
+        
+        Owners seen by get_or_create_conversation() are served from a cache,
+        so the hot message-write path skips the lookup query.
+        
+        Args:
+            conversation_id: Conversation ID
+            
+        Returns:
+            Database user ID of the conversation owner
+            
+        Raises:
+            ConversationError: If the conversation does not exist
+        """
+        user_id = self._conversation_user_ids.get(conversation_id)
+        if user_id is not None:
+            self._conversation_user_ids.move_to_end(conversation_id)
+            return user_id
+        
+        async with self.db_manager.get_session() as session:
+            stmt = select(Conversation.user_id).where(Conversation.id == conversation_id)
+            result = await session.execute(stmt)
+            user_id = result.scalar_one_or_none()
+            
+            if user_id is None:
+                raise ConversationError(f"Conversation {conversation_id} not found")
+        
+        self._cache_conversation_user_id(conversation_id, user_id)
+        return user_id
+    
     async def generate_response(
         self,
         conversation_id: int,
         system_prompt: Optional[str] = None,
         current_user_name: Optional[str] = None,
+        pending_messages: Optional[List[Dict[str, Any]]] = None,
     ) -> str:
         """
         Generate an LLM response for a conversation.
         
+        Collects the output of generate_response_stream().
+        
         Args:
             conversation_id: Conversation ID
             system_prompt: Optional custom system prompt
             current_user_name: Username of the person who just sent the message we're responding to
+            pending_messages: Message records that may not be written to the
+                database yet (same format as add_messages()) to append to the
+                history; records already stored are matched by Discord message ID
             
         Returns:
             Generated response text
             
+        Raises:
+            ConversationError: If response generation fails
+            LLMAPIError: If LLM API call fails
+        """
+        return "".join([
+            delta async for delta in self.generate_response_stream(
+                conversation_id,
+                system_prompt=system_prompt,
+                current_user_name=current_user_name,
+                pending_messages=pending_messages,
+            )
+        ])
+    
+    async def generate_response_stream(
+        self,
+        conversation_id: int,
+        system_prompt: Optional[str] = None,
+        current_user_name: Optional[str] = None,
+        pending_messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate an LLM response for a conversation, streaming its text.
+        
+        Cached and canned responses are yielded whole; otherwise deltas are
+        yielded as the LLM produces them, followed by any follow-up question.
+        
+        Args:
+            conversation_id: Conversation ID
+            system_prompt: Optional custom system prompt
+            current_user_name: Username of the person who just sent the message we're responding to
+            pending_messages: Message records that may not be written to the
+                database yet (same format as add_messages()) to append to the
+                history; records already stored are matched by Discord message ID
+            
+        Yields:
+            Consecutive pieces of the response text
+            
         Raises:
             ConversationError: If response generation fails
             LLMAPIError: If LLM API call fails
         """
         log_function_call("generate_response", conversation_id=conversation_id)
         
+        started = time.monotonic()
+        
         try:
             with log_operation_timing(
                 "generate_response",
@@ -315,6 +805,27 @@ class ConversationManager:
                         limit=self.config.max_history,
                     )
                 
+                if pending_messages:
+                    # A pending write may already have landed; skip those rows
+                    stored_ids = {
+                        msg.extra_data.get("discord_message_id")
+                        for msg in messages
+                        if isinstance(msg.extra_data, dict)
+                    }
+                    stored_ids.discard(None)
+                    messages.extend(
+                        Message(
+                            conversation_id=conversation_id,
+                            role=record["role"],
+                            content=record["content"],
+                            extra_data=record.get("extra_data"),
+                            is_deleted=False,
+                        )
+                        for record in pending_messages
+                        if (record.get("extra_data") or {}).get("discord_message_id") not in stored_ids
+                    )
+                    del messages[:-self.config.max_history]
+                
                 # DEBUG: Log message count and content overview
                 self.logger.info(f"Found {len(messages)} messages in conversation {conversation_id}")
                 for i, msg in enumerate(messages[-3:]):  # Show last 3 messages
@@ -328,44 +839,37 @@ class ConversationManager:
                         user_id=0,  # Unknown at this point
                         correlation_id=correlation_id,
                     )
-                    return "Hello! How can I help you today?"
+                    yield "Hello! How can I help you today?"
+                    return
                 
                 # Prepare context with memory management
                 prompt = system_prompt or self.default_system_prompt
                 
-                # Check if we should enhance with RAG
-                last_user_message = ""
-                conversation_context = ""
-                
-                # Get the last few messages for context
-                recent_messages = messages[-5:] if len(messages) > 5 else messages
-                for msg in recent_messages:
-                    # Extract username from extra_data if available - prefer display name
-                    username = "User"
-                    if hasattr(msg, 'extra_data') and msg.extra_data:
-                        if isinstance(msg.extra_data, dict):
-                            # Try display name first, fall back to username
-                            username = msg.extra_data.get('discord_display_name', 
-                                                        msg.extra_data.get('discord_username', 'User'))
-                        else:
-                            # Handle case where extra_data might be a JSON string
-                            try:
-                                import json
-                                extra_data = json.loads(msg.extra_data) if isinstance(msg.extra_data, str) else msg.extra_data
-                                # Try display name first, fall back to username
-                                username = extra_data.get('discord_display_name', 
-                                                        extra_data.get('discord_username', 'User'))
-                            except (json.JSONDecodeError, TypeError):
-                                username = "User"
+                # One pass from the newest message back collects the recent
+                # context lines and the most recent user message (for RAG
+                # triggering), stopping once both are complete
+                last_user_message: Optional[str] = None
+                context_lines: List[str] = []
+                for distance, msg in enumerate(reversed(messages)):
+                    in_window = distance < RECENT_CONTEXT_MESSAGES
+                    if not in_window and last_user_message is not None:
+                        break
                     
                     if msg.role == "user":
-                        conversation_context += f"{username}: {msg.content}\n"
-                    elif msg.role == "assistant":
+                        if last_user_message is None:
+                            last_user_message = msg.content
+                        if in_window:
+                            context_lines.append(f"{_extract_username(msg)}: {msg.content}")
+                    elif msg.role == "assistant" and in_window:
                         # Skip very long assistant responses that look like generic lists
-                        if len(msg.content) > 500 and ("Injuries" in msg.content or "recommendations" in msg.content):
-                            conversation_context += f"sci-assist: [provided sports recommendations]\n"
+                        if len(msg.content) > 500 and LIST_REPLY_PATTERN.search(msg.content):
+                            context_lines.append("sci-assist: [provided sports recommendations]")
                         else:
-                            conversation_context += f"sci-assist: {msg.content}\n"
+                            context_lines.append(f"sci-assist: {msg.content}")
+                
+                last_user_message = last_user_message or ""
+                context_lines.reverse()
+                conversation_context = "".join(f"{line}\n" for line in context_lines)
                 
                 # DEBUG: Log what conversation context we're seeing
                 if conversation_context.strip():
@@ -373,12 +877,6 @@ class ConversationManager:
                 else:
                     self.logger.info("No conversation context found - this may be the first message")
                 
-                # Get the most recent user message for RAG triggering
-                for msg in reversed(messages):
-                    if msg.role == "user":
-                        last_user_message = msg.content
-                        break
-                
                 # Get the current user's name from the most recent message or parameter
                 current_responding_to_user = current_user_name
                 self.logger.info(f"DEBUG: current_user_name parameter = '{current_user_name}'")
@@ -386,49 +884,93 @@ class ConversationManager:
                 if not current_responding_to_user and messages:
                     # Fallback: extract from the most recent user message
                     last_msg = messages[-1]
-                    if last_msg.role == "user" and hasattr(last_msg, 'extra_data') and last_msg.extra_data:
-                        if isinstance(last_msg.extra_data, dict):
-                            # Try display name first, fall back to username
-                            current_responding_to_user = last_msg.extra_data.get('discord_display_name', 
-                                                               last_msg.extra_data.get('discord_username', 'User'))
-                        else:
-                            try:
-                                import json
-                                extra_data = json.loads(last_msg.extra_data) if isinstance(last_msg.extra_data, str) else last_msg.extra_data
-                                # Try display name first, fall back to username
-                                current_responding_to_user = extra_data.get('discord_display_name', 
-                                                                   extra_data.get('discord_username', 'User'))
-                            except (json.JSONDecodeError, TypeError):
-                                current_responding_to_user = "User"
+                    if last_msg.role == "user" and last_msg.extra_data:
+                        current_responding_to_user = _extract_username(last_msg)
                 
                 self.logger.info(f"DEBUG: Final current_responding_to_user = '{current_responding_to_user}'")
                 
+                # Nothing below touches the RAG system when it is disabled,
+                # still loading, or there is no user query to retrieve for
+                rag = self.rag_integration if last_user_message and self._rag_config.enabled else None
+                use_rag = rag is not None and rag.is_available() and rag.should_use_rag(last_user_message)
+                
+                # Reuse a cached response if a near-identical RAG query was
+                # already answered after near-identical preceding turns. Only
+                # RAG queries are looked up, since they already need a query
+                # embedding and their retrieval is worth skipping.
+                query_embedding = context_embedding = None
+                if use_rag and self._rag_config.response_cache_enabled:
+                    preceding_turns = "\n".join(msg.content for msg in messages[-4:-1])
+                    query_embedding, context_embedding = await asyncio.gather(
+                        asyncio.to_thread(rag.embed_text, last_user_message),
+                        asyncio.to_thread(rag.embed_text, preceding_turns),
+                    )
+                    if query_embedding is not None and context_embedding is not None:
+                        cached_response = self.response_cache.lookup(
+                            conversation_id, last_user_message, query_embedding, context_embedding
+                        )
+                        if cached_response is not None:
+                            log_conversation_event(
+                                "response_cache_hit",
+                                conversation_id=conversation_id,
+                                user_id=messages[0].user_id if messages else 0,
+                                correlation_id=correlation_id,
+                            )
+                            self._record_response_latency(time.monotonic() - started)
+                            # The cached reply is stored without a follow-up
+                            # question; pick one for this turn
+                            yield self._maybe_add_followup_question(cached_response, messages)
+                            return
+                
+                # The system message is the static prompt only, so it is
+                # byte-identical across calls and stays cacheable by the LLM
+                # server. Everything that changes per call (recent context,
+                # RAG results, who we are responding to) goes in a note that
+                # is attached to the final user turn.
+                note_parts: List[str] = []
+                
+                # Start RAG retrieval if appropriate; it runs while the
+                # history is tokenized and trimmed below
+                rag_task = None
+                if use_rag:
+                    self.logger.info(f"Attempting RAG enhancement for query: {last_user_message[:100]}...")
+                    # Reuse the query embedding from the response cache lookup, if any
+                    rag_task = asyncio.create_task(
+                        rag.enhance_response(last_user_message, query_embedding)
+                    )
+                
+                with log_operation_timing(
+                    "prepare_context",
+                    conversation_id=conversation_id,
+                    message_count=len(messages),
+                    correlation_id=correlation_id,
+                ):
+                    chat_messages, total_tokens = self._prepare_context_cached(
+                        conversation_id,
+                        messages,
+                        system_prompt=prompt,
+                    )
+                
                 # Try to enhance with RAG if appropriate
                 rag_enhanced = False
-                if last_user_message and self.rag_integration.should_use_rag(last_user_message):
-                    self.logger.info(f"Attempting RAG enhancement for query: {last_user_message[:100]}...")
-                    
+                if rag_task is not None:
                     try:
-                        rag_result = await self.rag_integration.enhance_response(last_user_message)
+                        rag_result = await rag_task
                         if rag_result:
                             rag_context, sources = rag_result
                             
-                            # Enhance the system prompt with RAG context while preserving conversation flow
-                            enhanced_prompt = self.rag_integration.format_enhanced_prompt(
+                            # Add the RAG context while preserving conversation flow
+                            note_parts.append(rag.format_enhanced_prompt(
                                 original_query=last_user_message,
-                                user_context=prompt + f"\n\nRECENT CONVERSATION CONTEXT (important for understanding the query - reference users by name):\n{conversation_context}",
+                                user_context=f"RECENT CONVERSATION CONTEXT (important for understanding the query - reference users by name):\n{conversation_context}",
                                 rag_context=rag_context,
                                 sources=sources
-                            )
-                            enhanced_prompt += f"\nIMPORTANT: Keep response SHORT (2-3 sentences max) and reference specific users from the conversation.\n"
+                            ))
+                            note_parts.append("\nIMPORTANT: Keep response SHORT (2-3 sentences max) and reference specific users from the conversation.\n")
                             if current_responding_to_user:
-                                enhanced_prompt += f"\nYou are responding to {current_responding_to_user}'s message.\n"
+                                note_parts.append(f"\nYou are responding to {current_responding_to_user}'s message.\n")
                             
-                            prompt = enhanced_prompt
                             rag_enhanced = True
-                            
-                            self.logger.info(f"RAG enhancement successful, enhanced prompt length: {len(prompt)}")
-                            self.logger.debug(f"Final enhanced prompt being sent to LLM:\n{prompt[:500]}...")
                         else:
                             self.logger.debug("RAG enhancement returned empty result")
                     except Exception as e:
@@ -437,31 +979,31 @@ class ConversationManager:
                     # Even without RAG, include conversation context
                     if conversation_context.strip():
                         # Make the conversation flow more explicit
-                        context_header = "\n\nRECENT CONVERSATION CONTEXT (respond based on this discussion and reference users by name):\n"
-                        prompt = prompt + context_header + conversation_context
+                        note_parts.append("RECENT CONVERSATION CONTEXT (respond based on this discussion and reference users by name):\n")
+                        note_parts.append(conversation_context)
                         
                         # If the last user message is vague but conversation has clear context, note this
                         if last_user_message and len(last_user_message.split()) <= 10:  # Short/vague message
-                            prompt += f"\nNOTE: '{last_user_message}' was asked right after this discussion - respond based on the conversation topic, not as a standalone question.\n"
-                            prompt += f"IMPORTANT: Keep your response SHORT (2-3 sentences max) and reference the specific user who mentioned the relevant topic.\n"
+                            note_parts.append(f"\nNOTE: '{last_user_message}' was asked right after this discussion - respond based on the conversation topic, not as a standalone question.\n")
+                            note_parts.append("IMPORTANT: Keep your response SHORT (2-3 sentences max) and reference the specific user who mentioned the relevant topic.\n")
                         
                         # Always add information about who we're responding to
                         if current_responding_to_user:
-                            prompt += f"\nYou are responding to {current_responding_to_user}'s message.\n"
-                    
+                            note_parts.append(f"\nYou are responding to {current_responding_to_user}'s message.\n")
+                
+                context_note = "".join(note_parts)
+                
+                if rag_enhanced:
+                    self.logger.info(f"RAG enhancement successful, context note length: {len(context_note)}")
+                    self.logger.debug(f"Context note being sent to LLM:\n{context_note[:500]}...")
+                elif rag_task is None:
                     self.logger.debug(f"No RAG enhancement - using standard prompt with conversation context")
-                    # DEBUG: Log the full prompt being sent
-                    self.logger.info(f"Standard prompt being sent to LLM (first 1000 chars):\n{prompt[:1000]}...")
+                    # DEBUG: Log the context note being sent
+                    self.logger.info(f"Context note being sent to LLM (first 1000 chars):\n{context_note[:1000]}...")
                 
-                with log_operation_timing(
-                    "prepare_context",
-                    conversation_id=conversation_id,
-                    message_count=len(messages),
-                    correlation_id=correlation_id,
-                ):
-                    chat_messages, total_tokens = self.memory_manager.prepare_context(
-                        messages=messages,
-                        system_prompt=prompt,
+                if context_note:
+                    chat_messages, total_tokens = self.memory_manager.attach_context_note(
+                        chat_messages, total_tokens, context_note
                     )
                 
                 log_conversation_event(
@@ -483,41 +1025,54 @@ class ConversationManager:
                     correlation_id=correlation_id,
                 )
                 
-                # Generate response from LLM
+                # Stream the response from the LLM
+                response_parts: List[str] = []
                 with log_operation_timing(
                     "llm_generate_completion",
                     conversation_id=conversation_id,
                     correlation_id=correlation_id,
                 ):
-                    response = await self.llm_client.generate_chat_completion(
+                    async for delta in self.llm_client.generate_chat_completion_stream(
                         messages=chat_messages,
-                    )
+                    ):
+                        response_parts.append(delta)
+                        yield delta
+                
+                response_content = "".join(response_parts)
                 
                 log_conversation_event(
                     "response_generated",
                     conversation_id=conversation_id,
                     user_id=messages[0].user_id if messages else 0,
                     correlation_id=correlation_id,
-                    response_length=len(response.content),
-                    tokens_used=response.usage.total_tokens if response.usage else None,
-                    finish_reason=response.choices[0].finish_reason if response.choices else None,
+                    response_length=len(response_content),
                 )
                 
                 self.logger.debug(
                     "Generated LLM response",
                     conversation_id=conversation_id,
-                    response_length=len(response.content),
-                    tokens_used=response.usage.total_tokens if response.usage else None,
+                    response_length=len(response_content),
                     correlation_id=correlation_id,
                 )
                 
                 # Optionally add follow-up question to encourage discussion
                 enhanced_response = self._maybe_add_followup_question(
-                    response.content, 
+                    response_content, 
                     messages
                 )
+                if len(enhanced_response) > len(response_content):
+                    yield enhanced_response[len(response_content):]
+                
+                if query_embedding is not None and context_embedding is not None:
+                    self.response_cache.store(
+                        conversation_id,
+                        last_user_message,
+                        query_embedding,
+                        context_embedding,
+                        response_content,
+                    )
                 
-                return enhanced_response
+                self._record_response_latency(time.monotonic() - started)
             
         except LLMAPIError:
             # Re-raise LLM API errors as-is
@@ -534,7 +1089,7 @@ class ConversationManager:
         user_id: int,
         channel_id: int,
         guild_id: Optional[int] = None,
-    ) -> None:
+    ) -> int:
         """
         Reset a conversation by clearing its history.
         
@@ -543,6 +1098,9 @@ class ConversationManager:
             channel_id: Discord channel ID
             guild_id: Discord guild ID
             
+        Returns:
+            ID of the reset conversation
+            
         Raises:
             ConversationError: If conversation cannot be reset
         """
@@ -563,8 +1121,13 @@ class ConversationManager:
             
             # Reset it
             await self.db_manager.reset_conversation(conversation_id)
+            self.response_cache.invalidate(conversation_id)
+            self._invalidate_context_cache(conversation_id)
+            self._history_digests.pop(conversation_id, None)
+            self._conversation_user_ids.pop(conversation_id, None)
             
             self.logger.debug("Reset conversation", conversation_id=conversation_id)
+            return conversation_id
             
         except Exception as e:
             raise ConversationError(
@@ -611,10 +1174,10 @@ class ConversationManager:
                 limit=self.config.max_history,
             )
             
-            # Calculate context tokens
+            # Estimate context tokens from the stored per-message counts
             if messages:
-                chat_messages, context_tokens = self.memory_manager.prepare_context(
-                    messages=messages,
+                context_tokens = self.memory_manager.estimate_context_tokens(
+                    messages,
                     system_prompt=self.default_system_prompt,
                 )
             else:
@@ -653,6 +1216,12 @@ class ConversationManager:
                 days=self.config.auto_cleanup_days
             )
             
+            # Deactivated conversations get new rows on next use, and their
+            # cached responses must not outlive the cleared history
+            if count:
+                self._conversation_ids.clear()
+                self.response_cache.clear()
+            
             self.logger.info("Cleaned up old conversations", count=count)
             return count
             
@@ -677,21 +1246,17 @@ class ConversationManager:
             # Get conversation stats
             stats = await self.db_manager.get_conversation_stats(conversation_id)
             
-            # Get recent messages
-            messages = await self.db_manager.get_conversation_messages(
+            # Count roles over the recent messages in the database
+            role_counts = await self.db_manager.get_role_counts(
                 conversation_id=conversation_id,
                 limit=10,  # Last 10 messages for summary
             )
             
-            # Calculate some basic metrics
-            user_messages = [m for m in messages if m.role == "user"]
-            assistant_messages = [m for m in messages if m.role == "assistant"]
-            
             return {
                 "conversation_id": conversation_id,
                 "total_messages": stats["message_count"],
-                "user_messages": len(user_messages),
-                "assistant_messages": len(assistant_messages),
+                "user_messages": role_counts.get("user", 0),
+                "assistant_messages": role_counts.get("assistant", 0),
                 "total_tokens": stats["total_tokens"],
                 "created_at": stats["created_at"],
                 "last_activity": stats["last_message"],
@@ -730,44 +1295,20 @@ class ConversationManager:
         if '?' in response:
             return response
             
-        # Skip for emergency/medical advice responses
-        emergency_keywords = ['emergency', 'doctor', 'medical attention', 'call 911', 'urgent']
-        if any(keyword in response.lower() for keyword in emergency_keywords):
+        # Skip for emergency/medical advice responses; lowercasing once and
+        # using substring checks is several times faster than a
+        # case-insensitive regex
+        response_lower = response.lower()
+        if any(keyword in response_lower for keyword in EMERGENCY_RESPONSE_KEYWORDS):
             return response
             
         # Get the last user message to understand context
-        user_messages = [m for m in messages if m.role == "user"]
-        if not user_messages:
+        last_user = next((m for m in reversed(messages) if m.role == "user"), None)
+        if last_user is None:
             return response
-            
-        last_message = user_messages[-1].content.lower()
-        
-        # Topic-based follow-up questions
-        follow_up = None
-        
-        if any(word in last_message for word in ['transfer', 'moving', 'getting up', 'getting out']):
-            follow_up = "What transfer techniques have worked best for others here?"
-        elif any(word in last_message for word in ['wheelchair', 'chair', 'wheels']):
-            follow_up = "Anyone have experience with similar equipment?"
-        elif any(word in last_message for word in ['sport', 'racing', 'athletic', 'exercise', 'fitness']):
-            follow_up = "Has anyone else tried this activity?"
-        elif any(word in last_message for word in ['pain', 'hurt', 'sore', 'ache']):
-            follow_up = "What pain management strategies have others found helpful?"
-        elif any(word in last_message for word in ['tech', 'app', 'device', 'phone', 'computer']):
-            follow_up = "What other helpful tech tools are people using?"
-        elif any(word in last_message for word in ['work', 'job', 'career', 'employment']):
-            follow_up = "How have others navigated workplace accommodations?"
-        elif any(word in last_message for word in ['travel', 'trip', 'vacation', 'flying']):
-            follow_up = "What are your best travel tips for accessibility?"
-        elif any(word in last_message for word in ['help', 'advice', 'tips', 'suggestions']):
-            follow_up = "What has everyone else found helpful in similar situations?"
-        elif any(word in last_message for word in ['new', 'first time', 'just got', 'recently']):
-            follow_up = "What advice would others give to someone just starting out?"
-        elif any(word in last_message for word in ['problem', 'issue', 'trouble', 'difficult']):
-            follow_up = "How have others dealt with similar challenges?"
-        else:
-            # Default follow-up for general questions
-            follow_up = "What experiences have others had with this?"
+        
+        # Topic-based follow-up questions, first matching topic wins
+        follow_up = _find_followup_question(last_user.content.lower())
         
         # Add follow-up if we found a good one (always add when applicable)
         if follow_up:
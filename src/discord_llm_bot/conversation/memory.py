@@ -7,6 +7,10 @@ token counting to ensure optimal performance within LLM limits.
 """
 
 import tiktoken
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -15,6 +19,26 @@ from discord_llm_bot.utils.logging import get_logger, log_function_call
 from discord_llm_bot.llm.models import ChatMessage, MessageRole
 from discord_llm_bot.database.models import Message
 
+# Token overhead for the conversation structure, on top of per-message counts
+CONVERSATION_OVERHEAD_TOKENS = 10
+
+# Token counts cached by text (least recently used evicted first)
+TOKEN_COUNT_CACHE_SIZE = 4096
+
+# Chat roles by the role string stored on database messages
+MESSAGE_ROLES: Dict[str, MessageRole] = {role.value: role for role in MessageRole}
+
+
+@lru_cache(maxsize=1)
+def _get_encoder() -> tiktoken.Encoding:
+    """
+    Get the shared tiktoken encoder, loading it on first use.
+    
+    Returns:
+        The cl100k_base (GPT-4) encoding
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
 
 class MemoryManager:
     """
@@ -48,12 +72,20 @@ class MemoryManager:
         
         # Initialize tiktoken encoder for token counting
         try:
-            self.encoder = tiktoken.get_encoding("cl100k_base")  # GPT-4 encoding
+            self.encoder = _get_encoder()
         except Exception:
             # Fallback to a simple token counting method
             self.encoder = None
             self.logger.warning("Failed to load tiktoken encoder, using fallback token counting")
         
+        # The same history is counted on every turn (and several times while
+        # preparing one context), so each text is only encoded once
+        self._token_counts: OrderedDict[str, int] = OrderedDict()
+        
+        # Cleanup thresholds, fixed for the manager's configuration
+        self._cleanup_max_age = timedelta(days=config.auto_cleanup_days)
+        self._cleanup_message_threshold = config.max_history * 5
+        
         log_function_call(
             "MemoryManager.__init__",
             context_window_tokens=config.context_window_tokens,
@@ -70,9 +102,58 @@ class MemoryManager:
         Returns:
             Number of tokens
         """
+        count = self._token_counts.get(text)
+        if count is not None:
+            self._token_counts.move_to_end(text)
+            return count
+        
+        count = self._encode_count(text)
+        self._cache_token_count(text, count)
+        return count
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for several text strings in one encoder call.
+        
+        Cached counts are reused; tiktoken encodes the remaining texts on its
+        own thread pool, which is cheaper than one call per string.
+        
+        Args:
+            texts: Texts to count tokens for
+            
+        Returns:
+            Number of tokens for each text, in order
+        """
+        counts = [self._token_counts.get(text) for text in texts]
+        missing = [text for text, count in zip(texts, counts) if count is None]
+        if not missing:
+            return counts
+        
+        missing_counts = None
+        if self.encoder and len(missing) > 1:
+            try:
+                missing_counts = [
+                    len(tokens) for tokens in self.encoder.encode_ordinary_batch(missing)
+                ]
+            except Exception:
+                # Fall back to counting one at a time
+                pass
+        if missing_counts is None:
+            missing_counts = [self._encode_count(text) for text in missing]
+        
+        for text, count in zip(missing, missing_counts):
+            self._cache_token_count(text, count)
+        
+        missing_iter = iter(missing_counts)
+        return [count if count is not None else next(missing_iter) for count in counts]
+    
+    def _encode_count(self, text: str) -> int:
+        """Count the tokens in a text string without consulting the cache."""
         if self.encoder:
             try:
-                return len(self.encoder.encode(text))
+                # Special-token text is counted as plain text, which skips
+                # tiktoken's special-token scan
+                return len(self.encoder.encode_ordinary(text))
             except Exception:
                 # Fallback to simple counting
                 pass
@@ -80,6 +161,12 @@ class MemoryManager:
         # Simple fallback: roughly 4 characters per token
         return max(1, len(text) // 4)
     
+    def _cache_token_count(self, text: str, count: int) -> None:
+        """Remember a text's token count, evicting the least recently used."""
+        self._token_counts[text] = count
+        if len(self._token_counts) > TOKEN_COUNT_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+    
     def count_message_tokens(self, message: ChatMessage) -> int:
         """
         Count tokens for a chat message including role overhead.
@@ -90,9 +177,26 @@ class MemoryManager:
         Returns:
             Number of tokens including overhead
         """
-        # Count content tokens
-        content_tokens = self.count_tokens(message.content)
+        return self.count_tokens(message.content) + self._message_overhead_tokens(message)
+    
+    def count_message_tokens_batch(self, messages: List[ChatMessage]) -> List[int]:
+        """
+        Count tokens for several chat messages, including role overhead.
         
+        Args:
+            messages: Chat messages to count tokens for
+            
+        Returns:
+            Number of tokens including overhead for each message, in order
+        """
+        content_tokens = self.count_tokens_batch([message.content for message in messages])
+        return [
+            tokens + self._message_overhead_tokens(message)
+            for tokens, message in zip(content_tokens, messages)
+        ]
+    
+    def _message_overhead_tokens(self, message: ChatMessage) -> int:
+        """Count the role, formatting and name tokens of a chat message."""
         # Add overhead for role and formatting (roughly 4 tokens per message)
         overhead_tokens = 4
         
@@ -100,7 +204,7 @@ class MemoryManager:
         if message.name:
             overhead_tokens += self.count_tokens(message.name)
         
-        return content_tokens + overhead_tokens
+        return overhead_tokens
     
     def count_messages_tokens(self, messages: List[ChatMessage]) -> int:
         """
@@ -118,7 +222,7 @@ class MemoryManager:
             total_tokens += self.count_message_tokens(message)
         
         # Add a small overhead for the conversation structure
-        total_tokens += 10
+        total_tokens += CONVERSATION_OVERHEAD_TOKENS
         
         return total_tokens
     
@@ -126,6 +230,7 @@ class MemoryManager:
         self,
         messages: List[Message],
         system_prompt: Optional[str] = None,
+        context_note: Optional[str] = None,
     ) -> Tuple[List[ChatMessage], int]:
         """
         Prepare conversation context within token limits.
@@ -135,9 +240,16 @@ class MemoryManager:
         window limits. It uses intelligent truncation strategies to
         preserve the most important parts of the conversation.
         
+        The system prompt is always the first message and is never modified,
+        so it forms a stable prefix across calls. Per-call context goes in
+        ``context_note``, which is prepended to the final user message (or
+        appended as a trailing system message if the history does not end
+        with a user turn).
+        
         Args:
             messages: List of database messages
             system_prompt: Optional system prompt to include
+            context_note: Optional per-call context to attach at the end
             
         Returns:
             Tuple of (chat_messages, total_tokens)
@@ -148,42 +260,52 @@ class MemoryManager:
             system_prompt_length=len(system_prompt) if system_prompt else 0,
         )
         
-        chat_messages: List[ChatMessage] = []
-        
         # Add system prompt if provided
-        if system_prompt:
-            system_message = ChatMessage(
-                role=MessageRole.SYSTEM,
-                content=system_prompt
-            )
-            chat_messages.append(system_message)
-        
-        # Convert database messages to chat messages
-        all_messages = []
-        for msg in messages:
-            if msg.is_deleted:
-                continue
-                
-            chat_msg = ChatMessage(
-                role=MessageRole(msg.role),
-                content=msg.content,
-                extra_data=msg.extra_data,
-            )
-            all_messages.append(chat_msg)
+        chat_messages: List[ChatMessage] = [
+            ChatMessage(role=MessageRole.SYSTEM, content=system_prompt)
+        ] if system_prompt else []
+        system_tokens = self.count_message_tokens(chat_messages[0]) if chat_messages else 0
+        
+        # Pair database messages with the token count stored with each row,
+        # so the history is not re-tokenized
+        live_messages = [msg for msg in messages if not msg.is_deleted]
+        
+        # Rows stored without a count are tokenized together in one batch
+        # and the count kept on the loaded row
+        uncounted = [msg for msg in live_messages if not msg.token_count]
+        if uncounted:
+            token_counts = self.count_message_tokens_batch([
+                ChatMessage(role=MESSAGE_ROLES[msg.role], content=msg.content)
+                for msg in uncounted
+            ])
+            for msg, token_count in zip(uncounted, token_counts):
+                msg.token_count = token_count
+        
+        history = [(msg, msg.token_count) for msg in live_messages]
         
         # Apply truncation strategy to fit within limits
-        context_messages = self._apply_truncation_strategy(
-            all_messages,
-            available_tokens=self.config.context_window_tokens - (
-                self.count_message_tokens(chat_messages[0]) if chat_messages else 0
-            )
+        context_messages, history_tokens = self._apply_truncation_strategy(
+            history,
+            available_tokens=self.config.context_window_tokens - system_tokens,
         )
         
-        # Combine system prompt with context messages
-        chat_messages.extend(context_messages)
+        # Convert only the messages that fit to chat messages
+        chat_messages.extend([
+            ChatMessage(
+                role=MESSAGE_ROLES[msg.role],
+                content=msg.content,
+                extra_data=msg.extra_data,
+            )
+            for msg in context_messages
+        ])
         
         # Count final tokens
-        total_tokens = self.count_messages_tokens(chat_messages)
+        total_tokens = system_tokens + history_tokens + CONVERSATION_OVERHEAD_TOKENS
+        
+        if context_note:
+            chat_messages, total_tokens = self.attach_context_note(
+                chat_messages, total_tokens, context_note
+            )
         
         self.logger.debug(
             "Prepared conversation context",
@@ -194,11 +316,98 @@ class MemoryManager:
         
         return chat_messages, total_tokens
     
+    def estimate_context_tokens(
+        self,
+        messages: List[Message],
+        system_prompt: Optional[str] = None,
+    ) -> int:
+        """
+        Estimate the token count prepare_context() would report.
+        
+        Uses the token counts stored with each message instead of
+        re-tokenizing, and applies the same newest-first window as the
+        truncation strategy without building the chat messages.
+        
+        Args:
+            messages: List of database messages
+            system_prompt: Optional system prompt to include
+            
+        Returns:
+            Estimated total tokens of the prepared context
+        """
+        used_tokens = self.count_message_tokens(
+            ChatMessage(role=MessageRole.SYSTEM, content=system_prompt)
+        ) if system_prompt else 0
+        
+        for msg in reversed(messages):
+            if msg.is_deleted:
+                continue
+            
+            # Rows stored without a count are tokenized on the fly
+            message_tokens = msg.token_count or self.count_message_tokens(
+                ChatMessage(role=MESSAGE_ROLES[msg.role], content=msg.content)
+            )
+            if used_tokens + message_tokens > self.config.context_window_tokens:
+                break
+            used_tokens += message_tokens
+        
+        return used_tokens + CONVERSATION_OVERHEAD_TOKENS
+    
+    def attach_context_note(
+        self,
+        chat_messages: List[ChatMessage],
+        total_tokens: int,
+        context_note: str,
+    ) -> Tuple[List[ChatMessage], int]:
+        """
+        Attach a per-call note to an already prepared context.
+        
+        The oldest history messages are dropped until the note fits in the
+        context window, then the note is prepended to the final user message
+        (or appended as a trailing system message). Only the dropped and
+        changed messages are re-counted, so a context prepared before the
+        note was known can be reused cheaply.
+        
+        Args:
+            chat_messages: Context from prepare_context(); not modified
+            total_tokens: Token count returned with chat_messages
+            context_note: Per-call context to attach at the end
+            
+        Returns:
+            Tuple of (chat_messages, total_tokens)
+        """
+        chat_messages = list(chat_messages)
+        first_history_index = 1 if chat_messages and chat_messages[0].role == MessageRole.SYSTEM else 0
+        
+        # Make room for the note by dropping the oldest history messages
+        used_tokens = total_tokens - CONVERSATION_OVERHEAD_TOKENS
+        available_tokens = self.config.context_window_tokens - self.count_tokens(context_note)
+        while len(chat_messages) > first_history_index and used_tokens > available_tokens:
+            used_tokens -= self.count_message_tokens(chat_messages.pop(first_history_index))
+        
+        last_message = chat_messages[-1] if len(chat_messages) > first_history_index else None
+        if last_message is not None and last_message.role == MessageRole.USER:
+            used_tokens -= self.count_message_tokens(last_message)
+            chat_messages[-1] = ChatMessage(
+                role=MessageRole.USER,
+                content=f"{context_note}\n\n{last_message.content}",
+                name=last_message.name,
+                extra_data=last_message.extra_data,
+            )
+        else:
+            chat_messages.append(ChatMessage(
+                role=MessageRole.SYSTEM,
+                content=context_note,
+            ))
+        used_tokens += self.count_message_tokens(chat_messages[-1])
+        
+        return chat_messages, used_tokens + CONVERSATION_OVERHEAD_TOKENS
+    
     def _apply_truncation_strategy(
         self,
-        messages: List[ChatMessage],
+        messages: List[Tuple[Message, int]],
         available_tokens: int,
-    ) -> List[ChatMessage]:
+    ) -> Tuple[List[Message], int]:
         """
         Apply intelligent truncation to fit messages within token limits.
         
@@ -206,39 +415,40 @@ class MemoryManager:
         to preserve important parts of the conversation.
         
         Args:
-            messages: List of messages to truncate
+            messages: Messages to truncate, each paired with its token count
+                including role overhead
             available_tokens: Available token budget
             
         Returns:
-            Truncated list of messages
+            Tuple of (truncated messages, tokens they use)
         """
         if not messages:
-            return []
+            return [], 0
         
-        # Start with the most recent messages and work backwards
+        # Start with the most recent messages and work backwards, up to the
+        # maximum history limit
         result_messages = []
         used_tokens = 0
         
         # Always try to include the most recent exchange (user + assistant)
-        for message in reversed(messages):
-            message_tokens = self.count_message_tokens(message)
+        for message, message_tokens in reversed(messages):
+            if len(result_messages) >= self.config.max_history:
+                break
             
             if used_tokens + message_tokens <= available_tokens:
-                result_messages.insert(0, message)
+                result_messages.append(message)
                 used_tokens += message_tokens
             else:
                 break
         
+        result_messages.reverse()
+        
         # If we have very few messages, try to include more by summarizing
         if len(result_messages) < 4 and len(messages) > len(result_messages):
             # TODO: Implement conversation summarization
             # For now, just use what we have
             pass
         
-        # Ensure we don't exceed the maximum history limit
-        if len(result_messages) > self.config.max_history:
-            result_messages = result_messages[-self.config.max_history:]
-        
         self.logger.debug(
             "Applied truncation strategy",
             original_count=len(messages),
@@ -247,12 +457,13 @@ class MemoryManager:
             available_tokens=available_tokens,
         )
         
-        return result_messages
+        return result_messages, used_tokens
     
     def should_cleanup_conversation(
         self,
         conversation_updated: datetime,
         message_count: int,
+        now: Optional[datetime] = None,
     ) -> bool:
         """
         Determine if a conversation should be cleaned up.
@@ -260,18 +471,22 @@ class MemoryManager:
         Args:
             conversation_updated: When the conversation was last updated
             message_count: Number of messages in the conversation
+            now: Current UTC time; a cleanup sweep can pass one value for
+                every conversation instead of reading the clock each call
             
         Returns:
             True if the conversation should be cleaned up
         """
+        if now is None:
+            now = datetime.utcnow()
+        
         # Check age-based cleanup
-        age_threshold = datetime.utcnow() - timedelta(days=self.config.auto_cleanup_days)
-        if conversation_updated < age_threshold:
+        if now - conversation_updated > self._cleanup_max_age:
             return True
         
         # Check message count-based cleanup
         # Very long conversations might need cleanup
-        if message_count > self.config.max_history * 5:
+        if message_count > self._cleanup_message_threshold:
             return True
         
         return False
@@ -296,21 +511,16 @@ class MemoryManager:
             return []
         
         optimized = []
-        last_role = None
         
-        for message in messages:
-            # Skip deleted messages
-            if message.is_deleted:
-                continue
-            
-            # Consolidate consecutive messages from the same role
-            if message.role == last_role and optimized:
-                # Merge content with the previous message
-                last_message = optimized[-1]
-                last_message.content += f"\n\n{message.content}"
-                last_message.token_count += message.token_count
-            else:
-                optimized.append(message)
-                last_role = message.role
+        # Consolidate consecutive messages from the same role, skipping
+        # deleted messages
+        live_messages = (message for message in messages if not message.is_deleted)
+        for _, run in groupby(live_messages, key=attrgetter("role")):
+            first, *rest = run
+            if rest:
+                # Merge the run into its first message with a single join
+                first.content = "\n\n".join([first.content, *(message.content for message in rest)])
+                first.token_count += sum(message.token_count for message in rest)
+            optimized.append(first)
         
         return optimized
@@ -0,0 +1,185 @@
+"""
+Semantic response cache for conversation replies.
+
+This module caches generated responses per conversation and returns a
+cached response when a new query is semantically similar to one already
+answered in the same conversational context. Similarity is measured with
+the RAG system's embedding model, in two stages: the query itself, then
+the recent turns that preceded it. Embeddings barely separate queries that
+differ only in a number or a name, so those must also match exactly.
+"""
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+
+import numpy as np
+
+from discord_llm_bot.utils.logging import get_logger
+
+# Minimum cosine similarity between queries for a cache candidate
+QUERY_SIMILARITY_THRESHOLD = 0.92
+
+# Minimum cosine similarity between the preceding turns for a cache hit
+CONTEXT_SIMILARITY_THRESHOLD = 0.95
+
+# Cached responses kept per conversation (oldest evicted first)
+MAX_ENTRIES_PER_CONVERSATION = 32
+
+# Conversations with cached responses (least recently used evicted first)
+MAX_CACHED_CONVERSATIONS = 512
+
+# Numbers, and capitalized words other than a query's first, which a cached
+# query must share exactly with a new one
+_SALIENT_TOKEN_PATTERN = re.compile(r"\d+(?:[.,]\d+)*|(?<=\s)[A-Z][\w'-]*")
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response with the normalized embeddings it was stored under."""
+    
+    salient_tokens: FrozenSet[str]
+    query_embedding: np.ndarray
+    context_embedding: np.ndarray
+    response: str
+
+
+def _normalize(embedding: np.ndarray) -> np.ndarray:
+    """Scale an embedding to unit length so dot products are cosine similarities."""
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else embedding
+
+
+def _salient_tokens(query: str) -> FrozenSet[str]:
+    """Get the numbers and names in a query that a cache hit must match."""
+    return frozenset(_SALIENT_TOKEN_PATTERN.findall(query))
+
+
+class SemanticResponseCache:
+    """
+    Per-conversation cache of responses keyed by query and context embeddings.
+    
+    Entries are compared by brute-force cosine similarity; each conversation
+    holds at most MAX_ENTRIES_PER_CONVERSATION entries, so a matrix product
+    over them is cheaper than maintaining an ANN index.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.logger = get_logger(__name__)
+        self._entries: "OrderedDict[int, List[_CacheEntry]]" = OrderedDict()
+    
+    def lookup(
+        self,
+        conversation_id: int,
+        query: str,
+        query_embedding: np.ndarray,
+        context_embedding: np.ndarray,
+    ) -> Optional[str]:
+        """
+        Find a cached response for a similar query in a similar context.
+        
+        Args:
+            conversation_id: Conversation ID
+            query: The new user query
+            query_embedding: Embedding of the new user query
+            context_embedding: Embedding of the turns preceding the query
+        
+        Returns:
+            The cached response, or None on a miss
+        """
+        entries = self._entries.get(conversation_id)
+        if not entries:
+            return None
+        
+        self._entries.move_to_end(conversation_id)
+        
+        # Only queries naming the same numbers and names can match
+        salient_tokens = _salient_tokens(query)
+        entries = [e for e in entries if e.salient_tokens == salient_tokens]
+        if not entries:
+            return None
+        
+        # Stage 1: candidates with a similar query
+        query_scores = np.stack([e.query_embedding for e in entries]) @ _normalize(query_embedding)
+        candidates = np.flatnonzero(query_scores >= QUERY_SIMILARITY_THRESHOLD)
+        if candidates.size == 0:
+            return None
+        
+        # Stage 2: of those, the best one asked in a similar context
+        context = _normalize(context_embedding)
+        best_index, best_score = None, CONTEXT_SIMILARITY_THRESHOLD
+        for index in candidates:
+            score = float(entries[index].context_embedding @ context)
+            if score >= best_score:
+                best_index, best_score = index, score
+        
+        if best_index is None:
+            return None
+        
+        self.logger.debug(
+            "Semantic response cache hit",
+            conversation_id=conversation_id,
+            query_similarity=float(query_scores[best_index]),
+            context_similarity=best_score,
+        )
+        return entries[best_index].response
+    
+    def store(
+        self,
+        conversation_id: int,
+        query: str,
+        query_embedding: np.ndarray,
+        context_embedding: np.ndarray,
+        response: str,
+    ) -> None:
+        """
+        Cache a response for a query in its context.
+        
+        Args:
+            conversation_id: Conversation ID
+            query: The user query
+            query_embedding: Embedding of the user query
+            context_embedding: Embedding of the turns preceding the query
+            response: The generated response
+        """
+        entries = self._entries.setdefault(conversation_id, [])
+        self._entries.move_to_end(conversation_id)
+        
+        entries.append(_CacheEntry(
+            salient_tokens=_salient_tokens(query),
+            query_embedding=_normalize(query_embedding),
+            context_embedding=_normalize(context_embedding),
+            response=response,
+        ))
+        if len(entries) > MAX_ENTRIES_PER_CONVERSATION:
+            del entries[0]
+        
+        if len(self._entries) > MAX_CACHED_CONVERSATIONS:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, conversation_id: int) -> None:
+        """
+        Drop all cached responses for a conversation.
+        
+        Args:
+            conversation_id: Conversation ID
+        """
+        self._entries.pop(conversation_id, None)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache size statistics.
+        
+        Returns:
+            Dictionary with conversation and entry counts
+        """
+        return {
+            "conversations": len(self._entries),
+            "entries": sum(len(entries) for entries in self._entries.values()),
+        }
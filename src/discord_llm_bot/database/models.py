@@ -187,6 +187,8 @@ class Message(Base):
     __table_args__ = (
         Index("idx_messages_conversation", "conversation_id"),
         Index("idx_messages_conversation_created", "conversation_id", "created_at"),
+        # Serves the live-history query (is_deleted = false, newest first)
+        Index("idx_messages_conversation_live_created", "conversation_id", "is_deleted", "created_at"),
         Index("idx_messages_user", "user_id"),
         Index("idx_messages_role", "role"),
     )
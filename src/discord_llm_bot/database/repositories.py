@@ -11,15 +11,64 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from contextlib import asynccontextmanager
 
-from sqlalchemy import create_engine, select, update, delete, func, and_, or_
+from sqlalchemy import create_engine, select, update, delete, func, and_, or_, lambda_stmt, bindparam
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# orjson (de)serializes the JSON columns several times faster than the
+# standard library; without it SQLAlchemy's default json handling is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from discord_llm_bot.config import DatabaseConfig
 from discord_llm_bot.utils.logging import get_logger, log_function_call
 from discord_llm_bot.utils.exceptions import DatabaseError
 from discord_llm_bot.database.models import Base, User, Conversation, Message
 
+# Maximum number of queued messages written in one transaction
+WRITE_BATCH_MAX_SIZE = 32
+
+# Seconds the message writer waits for more messages before flushing a batch
+WRITE_BATCH_WINDOW_S = 0.02
+
+# Adds a batch's message and token counts to a conversation's counters;
+# executed with one parameter set per conversation
+_conversations = Conversation.__table__
+_CONVERSATION_COUNTERS_UPDATE = (
+    update(_conversations)
+    .where(_conversations.c.id == bindparam("b_conversation_id"))
+    .values(
+        message_count=_conversations.c.message_count + bindparam("b_message_count"),
+        total_tokens=_conversations.c.total_tokens + bindparam("b_total_tokens"),
+        updated_at=bindparam("b_updated_at"),
+    )
+)
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a JSON column value with orjson, allowing non-string keys like json does."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _settle(written: "asyncio.Future[None]", error: Optional[BaseException] = None) -> None:
+    """
+    Resolve a queued message's future unless its caller has gone away.
+    
+    Args:
+        written: Future awaited by add_message()
+        error: Exception to raise in the caller, or None on success
+    """
+    if written.done():
+        return
+    if error is None:
+        written.set_result(None)
+    else:
+        written.set_exception(error)
+
 
 class DatabaseManager:
     """
@@ -49,6 +98,11 @@ class DatabaseManager:
         self.session_factory = None
         self._closed = False
         
+        # Messages from add_message() waiting for the writer task, each with
+        # the future the caller awaits
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
         log_function_call("DatabaseManager.__init__", database_url=config.url)
     
     async def initialize(self) -> None:
@@ -74,12 +128,32 @@ class DatabaseManager:
             elif database_url.startswith("postgresql://"):
                 database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
             
-            # Create async engine
+            # Create async engine. The pool lives as long as the manager, so
+            # size it for peak message concurrency; in-memory SQLite uses a
+            # single static connection and takes no pool sizing options.
+            pool_options: Dict[str, Any] = {}
+            if make_url(database_url).database not in (None, "", ":memory:"):
+                pool_options = {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": self.config.pool_size,
+                    "max_overflow": self.config.max_overflow,
+                    "pool_timeout": self.config.pool_timeout,
+                }
+            
+            json_options: Dict[str, Any] = {}
+            if orjson is not None:
+                json_options = {
+                    "json_serializer": _dumps_json,
+                    "json_deserializer": orjson.loads,
+                }
+            
             self.engine = create_async_engine(
                 database_url,
                 echo=self.config.echo,
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections every hour
+                pool_recycle=self.config.pool_recycle,
+                **pool_options,
+                **json_options,
             )
             
             # Create session factory
@@ -93,6 +167,13 @@ class DatabaseManager:
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
             
+            # Start the writer that coalesces add_message() inserts
+            if self._writer_task is None:
+                self._write_queue = asyncio.Queue()
+                self._writer_task = asyncio.create_task(
+                    self._run_message_writer(), name="database_message_writer"
+                )
+            
             self.logger.info("Database initialization completed")
             
         except Exception as e:
@@ -150,6 +231,17 @@ class DatabaseManager:
             self.logger.warning("Database health check failed", error=str(e))
             return False
     
+    def pool_status(self) -> str:
+        """
+        Describe the current state of the connection pool.
+        
+        Returns:
+            SQLAlchemy's pool status summary, or a note if not initialized
+        """
+        if not self.engine:
+            return "not initialized"
+        return self.engine.pool.status()
+    
     # User management methods
     
     async def get_or_create_user(
@@ -285,16 +377,18 @@ class DatabaseManager:
             List of Message objects
         """
         async with self.get_session() as session:
-            stmt = select(Message).where(Message.conversation_id == conversation_id)
+            # Built as a lambda statement so the SQL construct is cached by
+            # code location; conversation_id and limit become bound parameters
+            stmt = lambda_stmt(lambda: select(Message).where(Message.conversation_id == conversation_id))
             
             if not include_deleted:
-                stmt = stmt.where(Message.is_deleted == False)
+                stmt += lambda s: s.where(Message.is_deleted == False)
             
             # Order by created_at DESC to get most recent messages first
-            stmt = stmt.order_by(Message.created_at.desc())
+            stmt += lambda s: s.order_by(Message.created_at.desc())
             
             if limit:
-                stmt = stmt.limit(limit)
+                stmt += lambda s: s.limit(limit)
             
             result = await session.execute(stmt)
             messages = list(result.scalars().all())
@@ -335,25 +429,177 @@ class DatabaseManager:
             token_count=token_count,
         )
         
+        if self._closed:
+            raise DatabaseError("Database manager has been closed")
+        if self._write_queue is None:
+            raise DatabaseError("Database not initialized")
+        
+        # Queue the message for the writer, which inserts it together with
+        # any others arriving in the same short window
+        message = Message(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            role=role,
+            content=content,
+            token_count=token_count,
+            extra_data=extra_data,
+        )
+        written = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((message, written))
+        await written
+        
+        self.logger.debug("Added message", message_id=message.id, conversation_id=conversation_id)
+        return message
+    
+    async def _run_message_writer(self) -> None:
+        """
+        Write queued add_message() messages in batches until cancelled.
+        
+        Each batch holds up to WRITE_BATCH_MAX_SIZE messages, collected for at
+        most WRITE_BATCH_WINDOW_S after the first one arrives, and is written
+        in a single transaction. If the batch fails, its messages are retried
+        one at a time so each caller gets its own message's result. There is
+        only one writer, so messages are inserted in the order they were queued.
+        """
+        queue = self._write_queue
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + WRITE_BATCH_WINDOW_S
+            while len(batch) < WRITE_BATCH_MAX_SIZE:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._write_message_batch([message for message, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    _settle(batch[0][1], e)
+                else:
+                    # One bad message rolls back the whole transaction, so
+                    # write each on its own to fail only that message's caller
+                    self.logger.warning(
+                        "Message batch write failed, retrying individually",
+                        count=len(batch),
+                        error=str(e),
+                    )
+                    for message, written in batch:
+                        try:
+                            await self._write_message_batch([message])
+                        except Exception as message_error:
+                            _settle(written, message_error)
+                        else:
+                            _settle(written)
+            else:
+                for _, written in batch:
+                    _settle(written)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _write_message_batch(self, messages: List[Message]) -> None:
+        """
+        Insert messages and update their conversations' counters in one transaction.
+        
+        Args:
+            messages: Messages to insert, in order
+        """
         async with self.get_session() as session:
-            # Create message
-            message = Message(
-                conversation_id=conversation_id,
-                user_id=user_id,
-                role=role,
-                content=content,
-                token_count=token_count,
-                extra_data=extra_data,
+            # The ORM fills in each message's ID on flush; backends that can
+            # order RETURNING rows (e.g. Postgres) get a single multi-row
+            # INSERT ... RETURNING, SQLite gets one INSERT per message
+            session.add_all(messages)
+            await session.flush()
+            
+            # Update each conversation's counters once for the batch
+            totals: Dict[int, List[int]] = {}
+            for message in messages:
+                counts = totals.setdefault(message.conversation_id, [0, 0])
+                counts[0] += 1
+                counts[1] += message.token_count
+            
+            # One executemany for all conversations in the batch rather than
+            # a round-trip per conversation
+            now = datetime.utcnow()
+            connection = await session.connection()
+            await connection.execute(
+                _CONVERSATION_COUNTERS_UPDATE,
+                [
+                    {
+                        "b_conversation_id": conversation_id,
+                        "b_message_count": count,
+                        "b_total_tokens": tokens,
+                        "b_updated_at": now,
+                    }
+                    for conversation_id, (count, tokens) in totals.items()
+                ],
             )
-            session.add(message)
             
-            # Update conversation counters
+            await session.commit()
+        
+        if len(messages) > 1:
+            self.logger.debug("Wrote coalesced message batch", count=len(messages))
+    
+    async def add_messages(
+        self,
+        conversation_id: int,
+        user_id: int,
+        messages: List[Dict[str, Any]],
+    ) -> List[Message]:
+        """
+        Add several messages to a conversation in a single transaction.
+        
+        Args:
+            conversation_id: Conversation ID
+            user_id: User ID
+            messages: Message records with ``role``, ``content`` and optional
+                ``token_count`` and ``extra_data`` keys
+            
+        Returns:
+            Created Message objects, in the order given
+        """
+        log_function_call(
+            "add_messages",
+            conversation_id=conversation_id,
+            message_count=len(messages),
+        )
+        
+        if not messages:
+            return []
+        
+        async with self.get_session() as session:
+            created = [
+                Message(
+                    conversation_id=conversation_id,
+                    user_id=user_id,
+                    role=record["role"],
+                    content=record["content"],
+                    token_count=record.get("token_count", 0),
+                    extra_data=record.get("extra_data"),
+                )
+                for record in messages
+            ]
+            session.add_all(created)
+            
+            # Update conversation counters once for the whole batch
             stmt = (
                 update(Conversation)
                 .where(Conversation.id == conversation_id)
                 .values(
-                    message_count=Conversation.message_count + 1,
-                    total_tokens=Conversation.total_tokens + token_count,
+                    message_count=Conversation.message_count + len(created),
+                    total_tokens=Conversation.total_tokens + sum(
+                        message.token_count for message in created
+                    ),
                     updated_at=datetime.utcnow(),
                 )
             )
@@ -361,8 +607,12 @@ class DatabaseManager:
             
             await session.commit()
             
-            self.logger.debug("Added message", message_id=message.id, conversation_id=conversation_id)
-            return message
+            self.logger.debug(
+                "Added messages",
+                message_ids=[message.id for message in created],
+                conversation_id=conversation_id,
+            )
+            return created
     
     async def reset_conversation(self, conversation_id: int) -> None:
         """
@@ -451,6 +701,41 @@ class DatabaseManager:
                 "last_message": last_message_time,
             }
     
+    async def get_role_counts(
+        self,
+        conversation_id: int,
+        limit: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Count a conversation's non-deleted messages by role.
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Only count the most recent messages, up to this many
+            
+        Returns:
+            Dictionary mapping role to message count
+        """
+        async with self.get_session() as session:
+            recent = (
+                select(Message.role)
+                .where(
+                    and_(
+                        Message.conversation_id == conversation_id,
+                        Message.is_deleted == False,
+                    )
+                )
+                .order_by(Message.created_at.desc())
+            )
+            if limit:
+                recent = recent.limit(limit)
+            recent = recent.subquery()
+            
+            stmt = select(recent.c.role, func.count()).group_by(recent.c.role)
+            result = await session.execute(stmt)
+            
+            return {role: count for role, count in result.all()}
+    
     async def cleanup_old_conversations(self, days: int = 30) -> int:
         """
         Clean up old conversations and their messages.
@@ -506,8 +791,20 @@ class DatabaseManager:
         if not self._closed:
             self.logger.debug("Closing database manager")
             
+            # Refuse new messages, then let the writer flush the queued ones
+            # before stopping it
+            self._closed = True
+            queue, self._write_queue = self._write_queue, None
+            if self._writer_task:
+                await queue.join()
+                self._writer_task.cancel()
+                try:
+                    await self._writer_task
+                except asyncio.CancelledError:
+                    pass
+                self._writer_task = None
+            
             if self.engine:
                 await self.engine.dispose()
             
-            self._closed = True
             self.logger.debug("Database manager closed")
@@ -9,7 +9,7 @@ adapted for custom LLM endpoints.
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 import json
 
 import aiohttp
@@ -41,6 +41,14 @@ from discord_llm_bot.llm.models import (
     MessageRole,
 )
 
+# Attempts to open a streaming completion before giving up; once tokens
+# have been yielded the stream cannot be retried
+STREAM_CONNECT_ATTEMPTS = 3
+
+# Server-sent event prefix and end marker of OpenAI-compatible streams
+SSE_DATA_PREFIX = b"data:"
+SSE_DONE = b"[DONE]"
+
 
 class LLMClient:
     """
@@ -55,7 +63,7 @@ class LLMClient:
     - Request/response validation with Pydantic
     - Comprehensive error handling and logging
     - Health check capabilities
-    - Support for streaming responses (future enhancement)
+    - Support for streaming responses
     - Rate limiting and timeout management
     
     Attributes:
@@ -305,6 +313,181 @@ class LLMClient:
                 original_error=e,
             )
     
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[ChatMessage],
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a chat completion, yielding content deltas as they arrive.
+        
+        Sends the same request as generate_chat_completion() with streaming
+        enabled and parses the server-sent events of an OpenAI-compatible
+        API. Connection failures are retried until the response starts.
+        
+        Args:
+            messages: List of conversation messages
+            **kwargs: Additional parameters to override defaults
+            
+        Yields:
+            Content deltas of the assistant message, in order
+            
+        Raises:
+            LLMAPIError: If the API call fails or returns an error
+        """
+        correlation_id = generate_correlation_id()
+        
+        log_function_call(
+            "generate_chat_completion_stream",
+            message_count=len(messages),
+            model=self.config.model_name,
+            correlation_id=correlation_id,
+        )
+        
+        request_data = ChatRequest(
+            model=self.config.model_name,
+            messages=messages,
+            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+            temperature=kwargs.get("temperature", self.config.temperature),
+            top_p=kwargs.get("top_p"),
+            frequency_penalty=kwargs.get("frequency_penalty"),
+            presence_penalty=kwargs.get("presence_penalty"),
+            stop=kwargs.get("stop"),
+            stream=True,
+        )
+        
+        request_dict = request_data.dict(exclude_none=True)
+        log_http_request(
+            method="POST",
+            url=self.config.api_url,
+            headers={"Content-Type": "application/json"},
+            body=request_dict,
+            service="llm",
+            correlation_id=correlation_id
+        )
+        
+        start_time = time.time()
+        
+        try:
+            session = await self._ensure_session()
+            
+            for attempt in range(STREAM_CONNECT_ATTEMPTS):
+                try:
+                    response = await session.post(self.config.api_url, json=request_dict)
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == STREAM_CONNECT_ATTEMPTS - 1:
+                        raise
+                    # Same backoff as generate_chat_completion()
+                    await asyncio.sleep(min(4 * 2 ** attempt, 10))
+            
+            async with response:
+                if response.status != 200:
+                    await self._handle_error_response(
+                        response.status,
+                        await response.text(),
+                        (time.time() - start_time) * 1000,
+                        correlation_id,
+                    )
+                
+                first_token_ms = None
+                finish_reason = None
+                usage = None
+                response_size = 0
+                
+                async for raw_line in response.content:
+                    line = raw_line.strip()
+                    if not line.startswith(SSE_DATA_PREFIX):
+                        continue
+                    
+                    payload = line[len(SSE_DATA_PREFIX):].strip()
+                    if payload == SSE_DONE:
+                        break
+                    
+                    try:
+                        event = json.loads(payload)
+                    except json.JSONDecodeError as e:
+                        raise LLMAPIError(
+                            "Failed to parse LLM API stream event",
+                            context={
+                                "event": payload[:500].decode("utf-8", "replace"),
+                                "correlation_id": correlation_id,
+                            },
+                            original_error=e,
+                        )
+                    
+                    usage = event.get("usage") or usage
+                    choices = event.get("choices") or []
+                    if not choices:
+                        continue
+                    
+                    finish_reason = choices[0].get("finish_reason") or finish_reason
+                    delta = (choices[0].get("delta") or {}).get("content")
+                    if delta:
+                        if first_token_ms is None:
+                            first_token_ms = (time.time() - start_time) * 1000
+                        response_size += len(delta)
+                        yield delta
+                
+                response_time_ms = (time.time() - start_time) * 1000
+                log_http_response(
+                    status_code=response.status,
+                    response_time_ms=response_time_ms,
+                    response_size=response_size,
+                    service="llm",
+                    correlation_id=correlation_id
+                )
+                log_llm_interaction(
+                    model=self.config.model_name,
+                    prompt_tokens=usage.get("prompt_tokens") if usage else None,
+                    completion_tokens=usage.get("completion_tokens") if usage else None,
+                    total_tokens=usage.get("total_tokens") if usage else None,
+                    response_time_ms=response_time_ms,
+                    correlation_id=correlation_id,
+                    finish_reason=finish_reason,
+                    message_count=len(messages),
+                    first_token_ms=first_token_ms,
+                )
+        
+        except aiohttp.ClientError as e:
+            response_time_ms = (time.time() - start_time) * 1000
+            error_msg = "Failed to communicate with LLM API"
+            log_http_response(
+                status_code=0,
+                response_time_ms=response_time_ms,
+                error=f"{error_msg}: {str(e)}",
+                service="llm",
+                correlation_id=correlation_id
+            )
+            raise LLMAPIError(
+                error_msg,
+                context={
+                    "api_url": self.config.api_url,
+                    "error_type": type(e).__name__,
+                    "correlation_id": correlation_id,
+                },
+                original_error=e,
+            )
+        except asyncio.TimeoutError as e:
+            response_time_ms = (time.time() - start_time) * 1000
+            error_msg = "LLM API request timed out"
+            log_http_response(
+                status_code=0,
+                response_time_ms=response_time_ms,
+                error=error_msg,
+                service="llm",
+                correlation_id=correlation_id
+            )
+            raise LLMAPIError(
+                error_msg,
+                context={
+                    "timeout": self.config.timeout,
+                    "api_url": self.config.api_url,
+                    "correlation_id": correlation_id,
+                },
+                original_error=e,
+            )
+    
     async def _handle_error_response(
         self, 
         status_code: int, 
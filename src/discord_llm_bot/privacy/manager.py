@@ -4,11 +4,16 @@ Privacy management implementation for Discord bot.
 
 import sqlite3
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 from dataclasses import dataclass
 
+# Storage decisions are cached per user to avoid a consent lookup per message
+STORE_DECISION_CACHE_TTL_SECONDS = 300
+STORE_DECISION_CACHE_MAX_SIZE = 10_000
+
 
 @dataclass
 class RetentionPolicy:
@@ -37,6 +42,8 @@ class PrivacyManager:
         self.db_path = db_path
         self.policy = policy
         self.logger = logging.getLogger(__name__)
+        # user_id -> (expires_at, should_store)
+        self._store_decisions: Dict[int, Tuple[float, bool]] = {}
         self._ensure_privacy_tables()
     
     def _ensure_privacy_tables(self):
@@ -115,19 +122,37 @@ class PrivacyManager:
         conn.commit()
         conn.close()
         
+        # Drop any cached decision so the new preference applies immediately
+        self.invalidate_consent(consent.user_id)
+        
         self.logger.info(f"Updated consent for user {consent.user_id}")
     
+    def invalidate_consent(self, user_id: int):
+        """Forget the cached storage decision for a user after a consent change."""
+        self._store_decisions.pop(user_id, None)
+    
     def should_store_message(self, user_id: int) -> bool:
         """Check if we should store messages for this user based on consent."""
         if not self.policy.user_consent_required:
             return True
+        
+        now = time.monotonic()
+        cached = self._store_decisions.get(user_id)
+        if cached and cached[0] > now:
+            return cached[1]
             
         consent = self.get_user_consent(user_id)
-        if not consent:
-            # Default to minimal storage if no consent given
-            return False
-            
-        return consent.data_retention_consent
+        # Default to minimal storage if no consent given
+        decision = consent.data_retention_consent if consent else False
+        
+        # Re-insert refreshed entries so eviction order tracks the newest decisions
+        self._store_decisions.pop(user_id, None)
+        if len(self._store_decisions) >= STORE_DECISION_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._store_decisions.pop(next(iter(self._store_decisions)))
+        self._store_decisions[user_id] = (now + STORE_DECISION_CACHE_TTL_SECONDS, decision)
+        
+        return decision
     
     def apply_retention_policy(self, dry_run: bool = True) -> Dict[str, Any]:
         """Apply data retention policy according to configuration."""
@@ -6,12 +6,15 @@ Wikipedia RAG system, handling query detection, response enhancement, and
 source attribution.
 """
 
+import asyncio
 import sys
 import os
 from pathlib import Path
 from typing import Optional, List, Tuple
 import logging
 
+import numpy as np
+
 # Force use of only GTX 1070 (device 0), hide GTX 960
 os.environ['CUDA_VISIBLE_DEVICES'] = '0'
 
@@ -92,6 +95,27 @@ class RAGIntegration:
         """Check if RAG system is available and ready to use."""
         return self._rag_system is not None
     
+    def embed_text(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed text with the RAG system's embedding model.
+        
+        This is a blocking call; run it in an executor from async code.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            Embedding vector, or None if the RAG system is unavailable or fails
+        """
+        if not self.is_available():
+            return None
+        
+        try:
+            return self._rag_system.embedding_model.embed_query(text)
+        except Exception as e:
+            self.logger.warning(f"Embedding failed: {e}")
+            return None
+    
     def should_use_rag(self, query: str) -> bool:
         """
         Determine if a query should be enhanced with RAG.
@@ -121,10 +145,10 @@ class RAGIntegration:
             return False
         
         # Check for trigger keywords (be more specific)
-        for keyword in self.config.trigger_keywords:
-            if keyword.lower() in query_lower:
-                self.logger.debug(f"RAG triggered by keyword: {keyword}")
-                return True
+        keyword = self.config.find_trigger_keyword(query_lower)
+        if keyword:
+            self.logger.debug(f"RAG triggered by keyword: {keyword}")
+            return True
         
         # Check for question patterns that benefit from factual information
         question_indicators = [
@@ -140,12 +164,18 @@ class RAGIntegration:
         
         return False
     
-    async def enhance_response(self, query: str) -> Optional[Tuple[str, List[str]]]:
+    async def enhance_response(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> Optional[Tuple[str, List[str]]]:
         """
         Get enhanced context from RAG system.
         
         Args:
             query: User query to enhance
+            query_embedding: Embedding of the query from embed_text(), if
+                already computed, so retrieval skips a second model pass
             
         Returns:
             Tuple of (enhanced_context, sources) if successful, None otherwise
@@ -156,8 +186,11 @@ class RAGIntegration:
         try:
             self.logger.info(f"Querying RAG system for: {query[:100]}...")
             
-            # Get chunks and scores from the RAG system retrieval
-            chunks, scores = self._rag_system.retrieve_context(query)
+            # Get chunks and scores from the RAG system retrieval; the
+            # embedding and vector search run off the event loop
+            chunks, scores = await asyncio.to_thread(
+                self._rag_system.retrieve_context, query, query_embedding
+            )
             
             if not chunks:
                 self.logger.warning("RAG system returned no relevant chunks")
@@ -17,11 +17,15 @@ Enhanced features:
 - Error tracking and debugging utilities
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
 import time
 import uuid
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional, Union
 from urllib.parse import urlparse
 
@@ -31,6 +35,12 @@ from rich.logging import RichHandler
 
 from discord_llm_bot.config import LoggingConfig
 
+# Maximum number of log records waiting for the listener thread
+LOG_QUEUE_MAX_SIZE = 10_000
+
+# Listener draining the root logger's queue, started by setup_logging()
+_queue_listener: Optional[QueueListener] = None
+
 
 def setup_logging(config: LoggingConfig) -> None:
     """
@@ -68,7 +78,13 @@ def setup_logging(config: LoggingConfig) -> None:
         # Development-style rich text logging
         _setup_rich_logging(config)
     
-    # Configure structlog
+    # Hand records to a background thread so handler I/O never blocks the event loop
+    _start_queue_listener()
+    
+    # Configure structlog to build its event dicts on the calling thread and
+    # pass them to the standard library loggers, so they go through the same
+    # queue and are rendered by the handlers' ProcessorFormatter on the
+    # listener thread
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -78,12 +94,13 @@ def setup_logging(config: LoggingConfig) -> None:
                 parameters=[structlog.processors.CallsiteParameter.FILENAME,
                            structlog.processors.CallsiteParameter.LINENO]
             ),
-            _structlog_processor if config.format == "json" else _rich_processor,
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, config.level)
         ),
-        logger_factory=structlog.WriteLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
     
@@ -91,12 +108,87 @@ def setup_logging(config: LoggingConfig) -> None:
     configure_external_loggers()
 
 
+class _DropOldestQueueHandler(QueueHandler):
+    """Queue handler that discards the oldest record when the queue is full."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record is passed as is
+        # rather than pre-formatted: structlog event dicts stay intact for
+        # ProcessorFormatter and exc_info stays set for rich tracebacks
+        return copy.copy(record)
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+def _start_queue_listener() -> None:
+    """
+    Move the root logger's handlers behind a queue drained by a listener thread.
+    
+    Logging calls then only enqueue the record; formatting and writing
+    happen on the listener thread. The queue is bounded by LOG_QUEUE_MAX_SIZE
+    and drops the oldest records when a slow handler falls behind.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+    
+    root_logger.handlers.clear()
+    root_logger.addHandler(_DropOldestQueueHandler(log_queue))
+    
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued log records on interpreter shutdown."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+def _capture_exc_info(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve ``exc_info=True`` to the current exception on the calling thread.
+    
+    The traceback is rendered later on the listener thread, where
+    sys.exc_info() no longer refers to the exception being logged.
+    """
+    exc_info = event_dict.get("exc_info")
+    if exc_info is True:
+        event_dict["exc_info"] = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        event_dict["exc_info"] = (type(exc_info), exc_info, exc_info.__traceback__)
+    return event_dict
+
+
 def _setup_json_logging(config: LoggingConfig) -> None:
     """Set up structured JSON logging for production."""
-    formatter = logging.Formatter(
-        fmt='{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"logger": "%(name)s", "message": "%(message)s"}',
-        datefmt="%Y-%m-%dT%H:%M:%SZ"
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            _structlog_processor,
+        ],
+        # Records from other libraries get the same fields as structlog events
+        foreign_pre_chain=[
+            structlog.processors.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
     )
     
     handler = logging.StreamHandler(sys.stdout)
@@ -119,6 +211,13 @@ def _setup_rich_logging(config: LoggingConfig) -> None:
         rich_tracebacks=True,
         tracebacks_show_locals=True,
     )
+    handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            _rich_processor,
+        ],
+    ))
     
     handler.setLevel(config.level)
     logging.getLogger().addHandler(handler)
@@ -191,6 +290,10 @@ def log_function_call(func_name: str, **kwargs: Any) -> None:
             # ... function implementation
         ```
     """
+    # Skip the logger lookup and event building when DEBUG is filtered out
+    if not logging.root.isEnabledFor(logging.DEBUG):
+        return
+    
     logger = get_logger()
     logger.debug("Function called", function=func_name, **kwargs)
 
@@ -0,0 +1,64 @@
+"""Tests for conversation context preparation."""
+
+import pytest
+
+from discord_llm_bot.config import ConversationConfig
+from discord_llm_bot.conversation.memory import MemoryManager
+from discord_llm_bot.database.models import Message
+from discord_llm_bot.llm.models import MessageRole
+
+SYSTEM_PROMPT = "You are a helpful AI assistant in a Discord server."
+
+
+@pytest.fixture
+def memory() -> MemoryManager:
+    """Create a memory manager with a small context window."""
+    return MemoryManager(ConversationConfig(max_history=10, context_window_tokens=1000))
+
+
+def _history(*turns: str) -> list:
+    """Build unsaved database messages alternating user and assistant turns."""
+    return [
+        Message(role="user" if index % 2 == 0 else "assistant", content=content, is_deleted=False)
+        for index, content in enumerate(turns)
+    ]
+
+
+def test_system_prompt_is_a_stable_prefix(memory):
+    """Per-call context never changes the leading system message."""
+    plain, _ = memory.prepare_context(_history("hi", "hello", "what time is it?"), SYSTEM_PROMPT)
+    noted, _ = memory.prepare_context(
+        _history("hi", "hello", "what time is it?"),
+        SYSTEM_PROMPT,
+        context_note="You are responding to alice's message.",
+    )
+    
+    assert plain[0].role == MessageRole.SYSTEM
+    assert plain[0].content == SYSTEM_PROMPT
+    assert noted[0] == plain[0]
+    assert noted[-1].content.startswith("You are responding to alice's message.")
+    assert noted[-1].content.endswith("what time is it?")
+
+
+def test_context_note_without_trailing_user_turn_is_appended(memory):
+    """A note after an assistant turn becomes a trailing system message."""
+    chat_messages, _ = memory.prepare_context(
+        _history("hi", "hello"), SYSTEM_PROMPT, context_note="Extra context."
+    )
+    
+    assert chat_messages[0].content == SYSTEM_PROMPT
+    assert chat_messages[-1].role == MessageRole.SYSTEM
+    assert chat_messages[-1].content == "Extra context."
+
+
+def test_truncation_keeps_system_prompt_first(memory):
+    """Dropping old history to fit a note leaves the system prompt untouched."""
+    turns = [f"message {index}" + " word" * 150 for index in range(9)]
+    
+    chat_messages, total_tokens = memory.prepare_context(
+        _history(*turns), SYSTEM_PROMPT, context_note="note " * 100
+    )
+    
+    assert chat_messages[0].content == SYSTEM_PROMPT
+    assert total_tokens <= memory.config.context_window_tokens
+    assert chat_messages[-1].content.endswith(turns[-1])
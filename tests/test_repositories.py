@@ -0,0 +1,56 @@
+"""Tests for the database manager's queued message writer."""
+
+import asyncio
+
+import pytest
+
+from discord_llm_bot.config import DatabaseConfig
+from discord_llm_bot.database.repositories import DatabaseManager
+from discord_llm_bot.utils.exceptions import DatabaseError
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Create an initialized database manager backed by a temporary file."""
+    manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'test.db'}"))
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+async def test_failed_message_does_not_fail_its_batch(db_manager):
+    """Only the caller whose message cannot be written sees the error."""
+    user = await db_manager.get_or_create_user(discord_id=1, username="tester")
+    conversation = await db_manager.get_or_create_conversation(user_id=user.id, channel_id=10)
+    
+    # Queued together, so the writer takes them as one batch
+    results = await asyncio.gather(
+        db_manager.add_message(conversation.id, user.id, "user", "first", token_count=3),
+        db_manager.add_message(conversation.id, None, "user", "no user", token_count=7),
+        db_manager.add_message(conversation.id, user.id, "assistant", "second", token_count=5),
+        return_exceptions=True,
+    )
+    
+    assert isinstance(results[1], Exception)
+    assert results[0].id is not None
+    assert results[2].id is not None
+    
+    messages = await db_manager.get_conversation_messages(conversation.id)
+    assert [message.content for message in messages] == ["first", "second"]
+    
+    stats = await db_manager.get_conversation_stats(conversation.id)
+    assert stats["message_count"] == 2
+    assert stats["total_tokens"] == 8
+
+
+async def test_add_message_after_close_raises(db_manager):
+    """add_message() fails fast once the manager is closed instead of waiting."""
+    user = await db_manager.get_or_create_user(discord_id=2, username="tester")
+    conversation = await db_manager.get_or_create_conversation(user_id=user.id, channel_id=20)
+    await db_manager.close()
+    
+    with pytest.raises(DatabaseError):
+        await asyncio.wait_for(
+            db_manager.add_message(conversation.id, user.id, "user", "late"),
+            timeout=1,
+        )
@@ -0,0 +1,79 @@
+"""Tests for the semantic response cache."""
+
+import numpy as np
+import pytest
+
+from discord_llm_bot.config import RAGConfig
+from discord_llm_bot.conversation.response_cache import SemanticResponseCache
+
+QUERY = "What dose of baclofen is usual with 10 mg tablets?"
+
+
+@pytest.fixture
+def cache() -> SemanticResponseCache:
+    """Create a cache holding one answered query."""
+    cache = SemanticResponseCache()
+    cache.store(1, QUERY, np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), "Usually 5 mg.")
+    return cache
+
+
+def test_cache_is_disabled_by_default():
+    """Responses are only reused when explicitly enabled."""
+    assert RAGConfig().response_cache_enabled is False
+
+
+def test_same_query_in_same_context_hits(cache):
+    """A near-identical query after near-identical turns reuses the response."""
+    response = cache.lookup(1, QUERY, np.array([0.99, 0.05, 0.0]), np.array([0.0, 1.0, 0.01]))
+    
+    assert response == "Usually 5 mg."
+
+
+@pytest.mark.parametrize("query", [
+    "What dose of baclofen is usual with 20 mg tablets?",
+    "What dose of Tizanidine is usual with 10 mg tablets?",
+    "What dose of baclofen is usual with tablets?",
+])
+def test_query_with_different_numbers_or_names_misses(cache, query):
+    """Embeddings cannot tell these apart, so the numbers and names must match."""
+    # Identical embeddings: only the query text differs
+    response = cache.lookup(1, query, np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+    
+    assert response is None
+
+
+def test_dissimilar_query_misses(cache):
+    """A query below the similarity threshold is not served from the cache."""
+    response = cache.lookup(1, QUERY, np.array([0.8, 0.6, 0.0]), np.array([0.0, 1.0, 0.0]))
+    
+    assert response is None
+
+
+def test_same_query_in_different_context_misses(cache):
+    """The same question after different turns is answered afresh."""
+    response = cache.lookup(1, QUERY, np.array([1.0, 0.0, 0.0]), np.array([0.0, 0.6, 0.8]))
+    
+    assert response is None
+
+
+def test_other_conversation_misses(cache):
+    """Responses are never shared between conversations."""
+    response = cache.lookup(2, QUERY, np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+    
+    assert response is None
+
+
+def test_invalidated_conversation_misses(cache):
+    """A reset conversation is not answered from responses cached before it."""
+    cache.invalidate(1)
+    
+    response = cache.lookup(1, QUERY, np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+    
+    assert response is None
+
+
+def test_cleared_cache_misses(cache):
+    """Clearing the cache drops every conversation's responses."""
+    cache.clear()
+    
+    assert cache.get_stats() == {"conversations": 0, "entries": 0}